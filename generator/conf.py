@@ -8,6 +8,13 @@ TEMPLATE_PATH = PKG_ROOT / "templates"
 # Device drivers
 OUTPUT_DIR_DEVICES_DRIVER = PKG_ROOT.parent / "src/zhinst/qcodes/driver/devices/"
 
+# Hand written functions of the generated driver classes by driver and class
+# name. The functions are defined in templates/extensions/<driver>/<class>.py.j2.
+# Toolkit functions with the same name are not forwarded.
+DRIVER_EXTENSIONS = {
+    "UHFQA": {"QAS": ["crosstalk_matrix", "read_results"]},
+}
+
 # devices API
 DEVICE_DRIVERS = ["SHFQA", "SHFSG", "SHFQC", "HDAWG", "PQSC", "UHFLI", "UHFQA"]
 TOOLKIT_DEVICE_MODULE = "zhinst.toolkit.driver.devices"
@@ -153,10 +153,17 @@ def generate_submodules_info(sub_modules: list, base_class: object) -> t.List[li
     for module, name, is_list in sub_modules:
         if name == "commandtable" and base_class.__name__ == "Generator":
             continue
-        if "typing.Optional" in str(module):
+        # Optional submodules are None if the device does not support them
+        is_optional = "typing.Optional" in str(module)
+        if is_optional:
             module = module.__args__[0]
         parent_info.append(
-            {"name": name, "class_name": module.__name__, "is_list": is_list}
+            {
+                "name": name,
+                "class_name": module.__name__,
+                "is_list": is_list,
+                "is_optional": is_optional,
+            }
         )
         submodule_info += generate_qcodes_class_info(
             module,
@@ -355,8 +362,21 @@ def generate_qcodes_driver(
         template_path (str):  jinja template location (default = "templates/")
         output_dir (str): output directory (default = "src/zhinst/qcodes/modules/")
     """
+    classes = generate_qcodes_class_info(toolkit_class)
+    extensions = conf.DRIVER_EXTENSIONS.get(toolkit_class.__name__, {})
+    for class_info in classes:
+        extension = extensions.get(class_info["name"])
+        if extension is None:
+            continue
+        class_info["functions"] = [
+            function
+            for function in class_info["functions"]
+            if function["name"] not in extension
+        ]
+        driver_name = toolkit_class.__name__.lower()
+        class_info["extension"] = f"extensions/{driver_name}/{class_info['name']}.py.j2"
     data = {
-        "classes": generate_qcodes_class_info(toolkit_class),
+        "classes": classes,
         "name": toolkit_class.__name__,
     }
 
@@ -451,27 +471,19 @@ def generate_device_api():
     DEVICE_API_FILEPATH = "src/zhinst/qcodes/device_creator.py"
     data = {
         "classes": [
-            {"name": "ZIDevice", "parent": "ZIBaseInstrument", "is_hf2": False},
-            {"name": "SHFQA", "parent": "SHFQADriver", "is_hf2": False},
-            {"name": "SHFSG", "parent": "SHFSGDriver", "is_hf2": False},
-            {"name": "HDAWG", "parent": "HDAWGDriver", "is_hf2": False},
-            {"name": "PQSC", "parent": "PQSCDriver", "is_hf2": False},
-            {"name": "SHFQC", "parent": "SHFQCDriver", "is_hf2": False},
-            {"name": "UHFLI", "parent": "UHFLIDriver", "is_hf2": False},
-            {"name": "UHFQA", "parent": "UHFQADriver", "is_hf2": False},
-            {"name": "MFLI", "parent": "ZIBaseInstrument", "is_hf2": False},
-            {"name": "MFIA", "parent": "ZIBaseInstrument", "is_hf2": False},
-            {"name": "HF2", "parent": "ZIBaseInstrument", "is_hf2": True},
-        ],
-        "imports": [
-            "from zhinst.qcodes.driver.devices.base import ZIBaseInstrument",
-            "from zhinst.qcodes.driver.devices.hdawg import HDAWG as HDAWGDriver",
-            "from zhinst.qcodes.driver.devices.pqsc import PQSC as PQSCDriver",
-            "from zhinst.qcodes.driver.devices.shfqa import SHFQA as SHFQADriver",
-            "from zhinst.qcodes.driver.devices.shfqc import SHFQC as SHFQCDriver",
-            "from zhinst.qcodes.driver.devices.shfsg import SHFSG as SHFSGDriver",
-            "from zhinst.qcodes.driver.devices.uhfli import UHFLI as UHFLIDriver",
-            "from zhinst.qcodes.driver.devices.uhfqa import UHFQA as UHFQADriver",
+            {"name": "ZIDevice", "has_driver": False, "is_hf2": False},
+            {"name": "SHFQA", "has_driver": True, "is_hf2": False},
+            {"name": "SHFSG", "has_driver": True, "is_hf2": False},
+            {"name": "HDAWG", "has_driver": True, "is_hf2": False},
+            {"name": "PQSC", "has_driver": True, "is_hf2": False},
+            {"name": "SHFQC", "has_driver": True, "is_hf2": False},
+            {"name": "UHFLI", "has_driver": True, "is_hf2": False},
+            {"name": "UHFQA", "has_driver": True, "is_hf2": False},
+            {"name": "SHFLI", "has_driver": False, "is_hf2": False},
+            {"name": "GHFLI", "has_driver": False, "is_hf2": False},
+            {"name": "MFLI", "has_driver": False, "is_hf2": False},
+            {"name": "MFIA", "has_driver": False, "is_hf2": False},
+            {"name": "HF2", "has_driver": False, "is_hf2": True},
         ],
     }
     templateLoader = jinja2.FileSystemLoader(searchpath=conf.TEMPLATE_PATH)
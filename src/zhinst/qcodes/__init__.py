@@ -1,16 +1,11 @@
 """QCoDeS Drivers for Zurich Instruments devices."""
+import typing as t
 
+from zhinst.qcodes import device_creator
 from zhinst.qcodes.session import ZISession
 from zhinst.qcodes.device_creator import (
-    HDAWG,
     MFLI,
     MFIA,
-    PQSC,
-    SHFQA,
-    SHFQC,
-    SHFSG,
-    UHFLI,
-    UHFQA,
     ZIDevice,
     HF2,
     SHFLI,
@@ -53,3 +48,10 @@ __all__ = [
     "AveragingMode",
     "SHFQAChannelMode",
 ]
+
+
+def __getattr__(name: str) -> t.Any:
+    """Forward the lazily created device classes of the device creator."""
+    if name in device_creator._LAZY_DEVICE_CLASSES:
+        return getattr(device_creator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,28 +3,59 @@
 The classes can be used without creating as session to a data server.
 """
 
+import importlib
+import logging
+import re
+import sys
+import threading
 import typing as t
+import weakref
 
 from zhinst.qcodes.driver.devices.base import ZIBaseInstrument
-from zhinst.qcodes.driver.devices.hdawg import HDAWG as HDAWGDriver
-from zhinst.qcodes.driver.devices.pqsc import PQSC as PQSCDriver
-from zhinst.qcodes.driver.devices.shfqa import SHFQA as SHFQADriver
-from zhinst.qcodes.driver.devices.shfqc import SHFQC as SHFQCDriver
-from zhinst.qcodes.driver.devices.shfsg import SHFSG as SHFSGDriver
-from zhinst.qcodes.driver.devices.uhfli import UHFLI as UHFLIDriver
-from zhinst.qcodes.driver.devices.uhfqa import UHFQA as UHFQADriver
-from zhinst.qcodes.session import ZISession
-
-
-class ZIDevice(ZIBaseInstrument):
-    """QCoDeS driver for the Zurich Instruments ZIDevice.
+from zhinst.qcodes.session import Session, ZISession
+
+__all__ = [
+    "ZIDevice",
+    "SHFQA",
+    "SHFSG",
+    "HDAWG",
+    "PQSC",
+    "SHFQC",
+    "UHFLI",
+    "UHFQA",
+    "SHFLI",
+    "GHFLI",
+    "MFLI",
+    "MFIA",
+    "HF2",
+    "prewarm",
+]
+
+# Device classes based on a dedicated driver. The driver module is only imported
+# once the class is accessed for the first time.
+_LAZY_DEVICE_CLASSES = {
+    "SHFQA": "zhinst.qcodes.driver.devices.shfqa",
+    "SHFSG": "zhinst.qcodes.driver.devices.shfsg",
+    "HDAWG": "zhinst.qcodes.driver.devices.hdawg",
+    "PQSC": "zhinst.qcodes.driver.devices.pqsc",
+    "SHFQC": "zhinst.qcodes.driver.devices.shfqc",
+    "UHFLI": "zhinst.qcodes.driver.devices.uhfli",
+    "UHFQA": "zhinst.qcodes.driver.devices.uhfqa",
+}
+
+_logger = logging.getLogger(__name__)
+
+# Serial numbers of Zurich Instruments devices, e.g. dev12000.
+_SERIAL_PATTERN = re.compile(r"dev\d+", re.IGNORECASE)
+
+_DEVICE_DOCSTRING = """QCoDeS driver for the Zurich Instruments {device}.
 
     Args:
         serial: Serial number of the device, e.g. *'dev12000'*.
             The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8004)
+        host: Host address of the data server (e.g. localhost)
+        port: Port number of the data server. If not specified the default
+            port of the device is used. (default = {default_port})
         interface: Device interface (e.g. = "1GbE"). If not specified
             the default interface from the discover is used.
         name: Name of the instrument in qcodes.
@@ -44,577 +75,341 @@ class ZIDevice(ZIBaseInstrument):
         new session directly.
     """
 
-    def __init__(
-        self,
-        serial: str,
-        host: str,
-        port: int = 8004,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(
-            host,
-            port,
-            hf2=False,
-            new_session=new_session,
-            allow_version_mismatch=allow_version_mismatch,
-        )
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
+# Sessions used by the device classes, keyed by
+# (host, port, hf2, allow_version_mismatch).
+_SESSION_CACHE: "weakref.WeakValueDictionary[tuple, Session]" = (
+    weakref.WeakValueDictionary()
+)
+_SESSION_CACHE_LOCK = threading.Lock()
 
 
-class SHFQA(SHFQADriver):
-    """QCoDeS driver for the Zurich Instruments SHFQA.
+def _get_session(
+    host: str, port: int, *, hf2: bool, new_session: bool, allow_version_mismatch: bool
+) -> Session:
+    """Get the session to a data server.
 
-    Args:
-        serial: Serial number of the device, e.g. *'dev12000'*.
-            The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8004)
-        interface: Device interface (e.g. = "1GbE"). If not specified
-            the default interface from the discover is used.
-        name: Name of the instrument in qcodes.
-        raw: Flag if qcodes instance should only created with the nodes and
-            not forwarding the toolkit functions. (default = False)
-        new_session: By default zhinst-qcodes reuses already existing data
-            server session (within itself only), meaning only one session to a
-            data server exists. Setting the flag will create a new session.
-        allow_version_mismatch: if set to True, the connection to the data-server
-            will succeed even if the data-server is on a different version of LabOne.
-            If False, an exception will be raised if the data-server is on a
-            different version. (default = False)
+    Sessions are cached so that creating multiple devices on the same data
+    server does not need to look up the existing session again. A new session
+    is never cached.
 
-    Warning:
-        Creating a new session should be done carefully and reusing
-        the created session is not possible. Consider instantiating a
-        new session directly.
+    Args:
+        host: Host address of the data server.
+        port: Port number of the data server.
+        hf2: Flag if the data server is a HF2 data server.
+        new_session: Flag if a new session to the data server should be
+            created.
+        allow_version_mismatch: Flag if the connection should succeed even if
+            the data server is on a different version of LabOne.
+
+    Returns:
+        Session to the data server.
     """
-
-    def __init__(
-        self,
-        serial: str,
-        host: str,
-        port: int = 8004,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(host, port, hf2=False, new_session=new_session)
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
-
-
-class SHFSG(SHFSGDriver):
-    """QCoDeS driver for the Zurich Instruments SHFSG.
+    if new_session:
+        return ZISession(
+            host,
+            port,
+            hf2=hf2,
+            new_session=True,
+            allow_version_mismatch=allow_version_mismatch,
+        )
+    key = (host, port, hf2, allow_version_mismatch)
+    with _SESSION_CACHE_LOCK:
+        session = _SESSION_CACHE.get(key)
+        if session is None or not Session.is_valid(session):
+            session = ZISession(
+                host,
+                port,
+                hf2=hf2,
+                allow_version_mismatch=allow_version_mismatch,
+            )
+            _SESSION_CACHE[key] = session
+        return session
+
+
+def _prewarm_session(
+    host: str, port: int, *, hf2: bool, allow_version_mismatch: bool
+) -> None:
+    """Create the cached session to a data server and log a failure.
 
     Args:
-        serial: Serial number of the device, e.g. *'dev12000'*.
-            The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8004)
-        interface: Device interface (e.g. = "1GbE"). If not specified
-            the default interface from the discover is used.
-        name: Name of the instrument in qcodes.
-        raw: Flag if qcodes instance should only created with the nodes and
-            not forwarding the toolkit functions. (default = False)
-        new_session: By default zhinst-qcodes reuses already existing data
-            server session (within itself only), meaning only one session to a
-            data server exists. Setting the flag will create a new session.
-        allow_version_mismatch: if set to True, the connection to the data-server
-            will succeed even if the data-server is on a different version of LabOne.
-            If False, an exception will be raised if the data-server is on a
-            different version. (default = False)
-
-    Warning:
-        Creating a new session should be done carefully and reusing
-        the created session is not possible. Consider instantiating a
-        new session directly.
+        host: Host address of the data server.
+        port: Port number of the data server.
+        hf2: Flag if the data server is a HF2 data server.
+        allow_version_mismatch: Flag if the connection should succeed even if
+            the data server is on a different version of LabOne.
     """
+    try:
+        _get_session(
+            host,
+            port,
+            hf2=hf2,
+            new_session=False,
+            allow_version_mismatch=allow_version_mismatch,
+        )
+    except Exception:
+        _logger.exception(
+            "Creating the session to the data server %s:%s failed.", host, port
+        )
 
-    def __init__(
-        self,
-        serial: str,
-        host: str,
-        port: int = 8004,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(host, port, hf2=False, new_session=new_session)
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
-
-
-class HDAWG(HDAWGDriver):
-    """QCoDeS driver for the Zurich Instruments HDAWG.
 
-    Args:
-        serial: Serial number of the device, e.g. *'dev12000'*.
-            The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8004)
-        interface: Device interface (e.g. = "1GbE"). If not specified
-            the default interface from the discover is used.
-        name: Name of the instrument in qcodes.
-        raw: Flag if qcodes instance should only created with the nodes and
-            not forwarding the toolkit functions. (default = False)
-        new_session: By default zhinst-qcodes reuses already existing data
-            server session (within itself only), meaning only one session to a
-            data server exists. Setting the flag will create a new session.
-        allow_version_mismatch: if set to True, the connection to the data-server
-            will succeed even if the data-server is on a different version of LabOne.
-            If False, an exception will be raised if the data-server is on a
-            different version. (default = False)
+def prewarm(
+    host: str,
+    port: t.Optional[int] = None,
+    *,
+    hf2: bool = False,
+    allow_version_mismatch: bool = False,
+) -> threading.Thread:
+    """Create the session to a data server in a background thread.
 
-    Warning:
-        Creating a new session should be done carefully and reusing
-        the created session is not possible. Consider instantiating a
-        new session directly.
-    """
+    Device classes instantiated afterwards for the same data server use the
+    session created by this function instead of establishing a new one. If
+    the session is still being created they wait for it to be ready.
 
-    def __init__(
-        self,
-        serial: str,
-        host: str,
-        port: int = 8004,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(host, port, hf2=False, new_session=new_session)
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
-
-
-class PQSC(PQSCDriver):
-    """QCoDeS driver for the Zurich Instruments PQSC.
+    Errors during the creation of the session are logged. The device classes
+    then try to create the session again.
 
     Args:
-        serial: Serial number of the device, e.g. *'dev12000'*.
-            The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8004)
-        interface: Device interface (e.g. = "1GbE"). If not specified
-            the default interface from the discover is used.
-        name: Name of the instrument in qcodes.
-        raw: Flag if qcodes instance should only created with the nodes and
-            not forwarding the toolkit functions. (default = False)
-        new_session: By default zhinst-qcodes reuses already existing data
-            server session (within itself only), meaning only one session to a
-            data server exists. Setting the flag will create a new session.
+        host: Host address of the data server (e.g. localhost)
+        port: Port number of the data server. If not specified the default
+            port is used. (default = 8004, 8005 for HF2)
+        hf2: Flag if the data server is a HF2 data server. (default = False)
         allow_version_mismatch: if set to True, the connection to the data-server
             will succeed even if the data-server is on a different version of LabOne.
-            If False, an exception will be raised if the data-server is on a
-            different version. (default = False)
+            (default = False)
 
-    Warning:
-        Creating a new session should be done carefully and reusing
-        the created session is not possible. Consider instantiating a
-        new session directly.
-    """
+    Returns:
+        Thread that creates the session.
 
-    def __init__(
-        self,
-        serial: str,
-        host: str,
-        port: int = 8004,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(host, port, hf2=False, new_session=new_session)
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
-
-
-class SHFQC(SHFQCDriver):
-    """QCoDeS driver for the Zurich Instruments SHFQC.
+    .. versionadded:: 0.6.1
+    """
+    if port is None:
+        port = 8005 if hf2 else 8004
+    thread = threading.Thread(
+        target=_prewarm_session,
+        args=(host, port),
+        kwargs={"hf2": hf2, "allow_version_mismatch": allow_version_mismatch},
+        daemon=True,
+    )
+    thread.start()
+    return thread
 
-    Args:
-        serial: Serial number of the device, e.g. *'dev12000'*.
-            The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8004)
-        interface: Device interface (e.g. = "1GbE"). If not specified
-            the default interface from the discover is used.
-        name: Name of the instrument in qcodes.
-        raw: Flag if qcodes instance should only created with the nodes and
-            not forwarding the toolkit functions. (default = False)
-        new_session: By default zhinst-qcodes reuses already existing data
-            server session (within itself only), meaning only one session to a
-            data server exists. Setting the flag will create a new session.
-        allow_version_mismatch: if set to True, the connection to the data-server
-            will succeed even if the data-server is on a different version of LabOne.
-            If False, an exception will be raised if the data-server is on a
-            different version. (default = False)
 
-    Warning:
-        Creating a new session should be done carefully and reusing
-        the created session is not possible. Consider instantiating a
-        new session directly.
-    """
+def _check_serial(serial: str) -> None:
+    """Check that a serial number is well formed.
 
-    def __init__(
-        self,
-        serial: str,
-        host: str,
-        port: int = 8004,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(host, port, hf2=False, new_session=new_session)
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
-
-
-class UHFLI(UHFLIDriver):
-    """QCoDeS driver for the Zurich Instruments UHFLI.
+    Catches typos before any request to the data server is sent.
 
     Args:
-        serial: Serial number of the device, e.g. *'dev12000'*.
-            The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8004)
-        interface: Device interface (e.g. = "1GbE"). If not specified
-            the default interface from the discover is used.
-        name: Name of the instrument in qcodes.
-        raw: Flag if qcodes instance should only created with the nodes and
-            not forwarding the toolkit functions. (default = False)
-        new_session: By default zhinst-qcodes reuses already existing data
-            server session (within itself only), meaning only one session to a
-            data server exists. Setting the flag will create a new session.
-        allow_version_mismatch: if set to True, the connection to the data-server
-            will succeed even if the data-server is on a different version of LabOne.
-            If False, an exception will be raised if the data-server is on a
-            different version. (default = False)
+        serial: Serial number of the device.
 
-    Warning:
-        Creating a new session should be done carefully and reusing
-        the created session is not possible. Consider instantiating a
-        new session directly.
+    Raises:
+        ValueError: If the serial number is malformed.
     """
+    if not _SERIAL_PATTERN.fullmatch(serial):
+        raise ValueError(
+            f"{serial!r} is not a valid serial number. "
+            "Serial numbers have the form 'dev12000'."
+        )
 
-    def __init__(
-        self,
-        serial: str,
-        host: str,
-        port: int = 8004,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(host, port, hf2=False, new_session=new_session)
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
-
-
-class UHFQA(UHFQADriver):
-    """QCoDeS driver for the Zurich Instruments UHFQA.
-
-    Args:
-        serial: Serial number of the device, e.g. *'dev12000'*.
-            The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8004)
-        interface: Device interface (e.g. = "1GbE"). If not specified
-            the default interface from the discover is used.
-        name: Name of the instrument in qcodes.
-        raw: Flag if qcodes instance should only created with the nodes and
-            not forwarding the toolkit functions. (default = False)
-        new_session: By default zhinst-qcodes reuses already existing data
-            server session (within itself only), meaning only one session to a
-            data server exists. Setting the flag will create a new session.
-        allow_version_mismatch: if set to True, the connection to the data-server
-            will succeed even if the data-server is on a different version of LabOne.
-            If False, an exception will be raised if the data-server is on a
-            different version. (default = False)
 
-    Warning:
-        Creating a new session should be done carefully and reusing
-        the created session is not possible. Consider instantiating a
-        new session directly.
-    """
+def _connect(
+    device: ZIBaseInstrument,
+    serial: str,
+    host: str,
+    port: int,
+    *,
+    hf2: bool,
+    interface: t.Optional[str],
+    name: t.Optional[str],
+    raw: bool,
+    new_session: bool,
+    allow_version_mismatch: bool,
+) -> None:
+    """Connect to a device and initialize its QCoDeS driver.
 
-    def __init__(
-        self,
-        serial: str,
-        host: str,
-        port: int = 8004,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(host, port, hf2=False, new_session=new_session)
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
-
-
-class SHFLI(ZIBaseInstrument):
-    """QCoDeS driver for the Zurich Instruments SHFLI.
+    Shared implementation of the ``__init__`` of all device classes.
 
     Args:
-        serial: Serial number of the device, e.g. *'dev12000'*.
-            The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8004)
-        interface: Device interface (e.g. = "1GbE"). If not specified
-            the default interface from the discover is used.
+        device: Instance of the device class that is initialized.
+        serial: Serial number of the device.
+        host: Host address of the data server.
+        port: Port number of the data server.
+        hf2: Flag if the data server is a HF2 data server.
+        interface: Device interface. If not specified the default interface
+            from the discover is used.
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
-            not forwarding the toolkit functions. (default = False)
-        new_session: By default zhinst-qcodes reuses already existing data
-            server session (within itself only), meaning only one session to a
-            data server exists. Setting the flag will create a new session.
-        allow_version_mismatch: if set to True, the connection to the data-server
-            will succeed even if the data-server is on a different version of LabOne.
-            If False, an exception will be raised if the data-server is on a
-            different version. (default = False)
-
-    Warning:
-        Creating a new session should be done carefully and reusing
-        the created session is not possible. Consider instantiating a
-        new session directly.
+            not forwarding the toolkit functions.
+        new_session: Flag if a new session to the data server should be
+            created.
+        allow_version_mismatch: Flag if the connection should succeed even if
+            the data server is on a different version of LabOne.
     """
-
-    def __init__(
-        self,
-        serial: str,
-        host: str,
-        port: int = 8004,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(host, port, hf2=False, new_session=new_session)
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
-
-
-class GHFLI(ZIBaseInstrument):
-    """QCoDeS driver for the Zurich Instruments GHFLI.
+    _check_serial(serial)
+    session = _get_session(
+        host,
+        port,
+        hf2=hf2,
+        new_session=new_session,
+        allow_version_mismatch=allow_version_mismatch,
+    )
+    _connect_on_session(device, session, serial, interface, name, raw)
+
+
+def _connect_on_session(
+    device: ZIBaseInstrument,
+    session: Session,
+    serial: str,
+    interface: t.Optional[str],
+    name: t.Optional[str],
+    raw: bool,
+) -> None:
+    """Connect to a device on a session and initialize its QCoDeS driver.
 
     Args:
-        serial: Serial number of the device, e.g. *'dev12000'*.
-            The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8004)
-        interface: Device interface (e.g. = "1GbE"). If not specified
-            the default interface from the discover is used.
+        device: Instance of the device class that is initialized.
+        session: Session to the data server.
+        serial: Serial number of the device.
+        interface: Device interface. If not specified the default interface
+            from the discover is used.
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
-            not forwarding the toolkit functions. (default = False)
-        new_session: By default zhinst-qcodes reuses already existing data
-            server session (within itself only), meaning only one session to a
-            data server exists. Setting the flag will create a new session.
-        allow_version_mismatch: if set to True, the connection to the data-server
-            will succeed even if the data-server is on a different version of LabOne.
-            If False, an exception will be raised if the data-server is on a
-            different version. (default = False)
-
-    Warning:
-        Creating a new session should be done carefully and reusing
-        the created session is not possible. Consider instantiating a
-        new session directly.
+            not forwarding the toolkit functions.
     """
-
-    def __init__(
+    tk_device = session.toolkit_session.connect_device(serial, interface=interface)
+    # Continue the MRO after the generated device class, so that an __init__
+    # of the driver or of any class in between is not skipped.
+    device_class = next(
+        cls
+        for cls in type(device).__mro__
+        if cls.__dict__.get("__init__") is _init_device
+    )
+    super(device_class, device).__init__(tk_device, session, name=name, raw=raw)
+    session.devices._register(device)
+
+
+def _init_device(
+    self,
+    serial: str,
+    host: str,
+    port: t.Optional[int] = None,
+    *,
+    interface: t.Optional[str] = None,
+    name=None,
+    raw=False,
+    new_session: bool = False,
+    allow_version_mismatch: bool = False,
+):
+    """Shared ``__init__`` of all device classes."""
+    _connect(
         self,
-        serial: str,
-        host: str,
-        port: int = 8004,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(host, port, hf2=False, new_session=new_session)
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
-
-
-class MFLI(ZIBaseInstrument):
-    """QCoDeS driver for the Zurich Instruments MFLI.
+        serial,
+        host,
+        port if port is not None else self._DEFAULT_PORT,
+        hf2=self._HF2,
+        interface=interface,
+        name=name,
+        raw=raw,
+        new_session=new_session,
+        allow_version_mismatch=allow_version_mismatch,
+    )
+
+
+def _from_session(
+    cls,
+    session: Session,
+    serial: str,
+    *,
+    interface: t.Optional[str] = None,
+    name: t.Optional[str] = None,
+    raw: bool = False,
+):
+    """Create the device on an existing session.
+
+    In contrast to the constructor the session is not looked up from the
+    host and port of the data server but passed directly.
 
     Args:
+        session: Session to the data server.
         serial: Serial number of the device, e.g. *'dev12000'*.
             The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8004)
         interface: Device interface (e.g. = "1GbE"). If not specified
             the default interface from the discover is used.
         name: Name of the instrument in qcodes.
         raw: Flag if qcodes instance should only created with the nodes and
             not forwarding the toolkit functions. (default = False)
-        new_session: By default zhinst-qcodes reuses already existing data
-            server session (within itself only), meaning only one session to a
-            data server exists. Setting the flag will create a new session.
-        allow_version_mismatch: if set to True, the connection to the data-server
-            will succeed even if the data-server is on a different version of LabOne.
-            If False, an exception will be raised if the data-server is on a
-            different version. (default = False)
 
-    Warning:
-        Creating a new session should be done carefully and reusing
-        the created session is not possible. Consider instantiating a
-        new session directly.
-    """
+    Returns:
+        Device object.
 
-    def __init__(
-        self,
-        serial: str,
-        host: str,
-        port: int = 8004,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(host, port, hf2=False, new_session=new_session)
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
-
-
-class MFIA(ZIBaseInstrument):
-    """QCoDeS driver for the Zurich Instruments MFIA.
+    Raises:
+        ValueError: If the serial number is malformed.
 
-    Args:
-        serial: Serial number of the device, e.g. *'dev12000'*.
-            The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8004)
-        interface: Device interface (e.g. = "1GbE"). If not specified
-            the default interface from the discover is used.
-        name: Name of the instrument in qcodes.
-        raw: Flag if qcodes instance should only created with the nodes and
-            not forwarding the toolkit functions. (default = False)
-        new_session: By default zhinst-qcodes reuses already existing data
-            server session (within itself only), meaning only one session to a
-            data server exists. Setting the flag will create a new session.
-        allow_version_mismatch: if set to True, the connection to the data-server
-            will succeed even if the data-server is on a different version of LabOne.
-            If False, an exception will be raised if the data-server is on a
-            different version. (default = False)
-
-    Warning:
-        Creating a new session should be done carefully and reusing
-        the created session is not possible. Consider instantiating a
-        new session directly.
+    .. versionadded:: 0.6.1
     """
+    _check_serial(serial)
+    device = cls.__new__(cls)
+    _connect_on_session(device, session, serial, interface, name, raw)
+    return device
 
-    def __init__(
-        self,
-        serial: str,
-        host: str,
-        port: int = 8004,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(host, port, hf2=False, new_session=new_session)
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
-
-
-class HF2(ZIBaseInstrument):
-    """QCoDeS driver for the Zurich Instruments HF2.
 
-    Args:
-        serial: Serial number of the device, e.g. *'dev12000'*.
-            The serial number can be found on the back panel of the instrument.
-        server_host: Host address of the data server (e.g. localhost)
-        server_port: Port number of the data server. If not specified the session
-            uses the default port. (default = 8005)
-        interface: Device interface (e.g. = "1GbE"). If not specified
-            the default interface from the discover is used.
-        name: Name of the instrument in qcodes.
-        raw: Flag if qcodes instance should only created with the nodes and
-            not forwarding the toolkit functions. (default = False)
-        new_session: By default zhinst-qcodes reuses already existing data
-            server session (within itself only), meaning only one session to a
-            data server exists. Setting the flag will create a new session.
-        allow_version_mismatch: if set to True, the connection to the data-server
-            will succeed even if the data-server is on a different version of LabOne.
-            If False, an exception will be raised if the data-server is on a
-            different version. (default = False)
+def _make_device_class(
+    name: str,
+    base: t.Type[ZIBaseInstrument],
+    *,
+    default_port: int = 8004,
+    hf2: bool = False,
+) -> t.Type[ZIBaseInstrument]:
+    """Create a device class that connects the device on instantiation.
 
-    Warning:
-        Creating a new session should be done carefully and reusing
-        the created session is not possible. Consider instantiating a
-        new session directly.
+    Args:
+        name: Name of the device class.
+        base: QCoDeS driver the device class is based on.
+        default_port: Default port of the data server. (default = 8004)
+        hf2: Flag if the device is connected to a HF2 data server.
+            (default = False)
+
+    Returns:
+        Device class.
     """
-
-    def __init__(
-        self,
-        serial: str,
-        host: str,
-        port: int = 8005,
-        *,
-        interface: t.Optional[str] = None,
-        name=None,
-        raw=False,
-        new_session: bool = False,
-        allow_version_mismatch: bool = False,
-    ):
-        session = ZISession(host, port, hf2=True, new_session=new_session)
-        tk_device = session.toolkit_session.connect_device(serial, interface=interface)
-        super().__init__(tk_device, session, name=name, raw=raw)
-        session.devices[self.serial] = self
+    # Like regular docstrings, the generated ones are dropped when running with -OO.
+    if sys.flags.optimize >= 2:
+        doc = None
+    else:
+        doc = _DEVICE_DOCSTRING.format(device=name, default_port=default_port)
+    return type(
+        name,
+        (base,),
+        {
+            "__init__": _init_device,
+            "from_session": classmethod(_from_session),
+            "_DEFAULT_PORT": default_port,
+            "_HF2": hf2,
+            "__doc__": doc,
+            "__module__": __name__,
+        },
+    )
+
+
+def __getattr__(name: str) -> t.Any:
+    """Create the driver based device classes on first access."""
+    module_name = _LAZY_DEVICE_CLASSES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    driver = getattr(importlib.import_module(module_name), name)
+    device_class = _make_device_class(name, driver)
+    # Another thread might have created the class in the meantime.
+    return globals().setdefault(name, device_class)
+
+
+def __dir__() -> t.List[str]:
+    """List the module attributes including the not yet created classes."""
+    return sorted(set(globals()) | set(__all__))
+
+
+ZIDevice = _make_device_class("ZIDevice", ZIBaseInstrument)
+SHFLI = _make_device_class("SHFLI", ZIBaseInstrument)
+GHFLI = _make_device_class("GHFLI", ZIBaseInstrument)
+MFLI = _make_device_class("MFLI", ZIBaseInstrument)
+MFIA = _make_device_class("MFIA", ZIBaseInstrument)
+HF2 = _make_device_class("HF2", ZIBaseInstrument, default_port=8005, hf2=True)
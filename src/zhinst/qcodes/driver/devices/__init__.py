@@ -1,27 +1,79 @@
-"""Module for all device drivers."""
+"""Module for all device drivers.
+
+The device specific drivers are only imported once they are accessed.
+"""
+import importlib
 import typing as t
+from collections.abc import Mapping
 
 from zhinst.qcodes.driver.devices.base import ZIBaseInstrument
-from zhinst.qcodes.driver.devices.hdawg import HDAWG
-from zhinst.qcodes.driver.devices.pqsc import PQSC
-from zhinst.qcodes.driver.devices.shfqa import SHFQA
-from zhinst.qcodes.driver.devices.shfqc import SHFQC
-from zhinst.qcodes.driver.devices.shfsg import SHFSG
-from zhinst.qcodes.driver.devices.uhfli import UHFLI
-from zhinst.qcodes.driver.devices.uhfqa import UHFQA
-
-DeviceType = t.Union[ZIBaseInstrument, HDAWG, PQSC, SHFQA, SHFQC, SHFSG, UHFLI, UHFQA]
-
-DEVICE_CLASS_BY_MODEL = {
-    "SHFQA": SHFQA,
-    "SHFQC": SHFQC,
-    "SHFSG": SHFSG,
-    "HDAWG": HDAWG,
-    "PQSC": PQSC,
-    "UHFQA": UHFQA,
-    "UHFLI": UHFLI,
+
+if t.TYPE_CHECKING:
+    from zhinst.qcodes.driver.devices.hdawg import HDAWG
+    from zhinst.qcodes.driver.devices.pqsc import PQSC
+    from zhinst.qcodes.driver.devices.shfqa import SHFQA
+    from zhinst.qcodes.driver.devices.shfqc import SHFQC
+    from zhinst.qcodes.driver.devices.shfsg import SHFSG
+    from zhinst.qcodes.driver.devices.uhfli import UHFLI
+    from zhinst.qcodes.driver.devices.uhfqa import UHFQA
+
+    DeviceType = t.Union[
+        ZIBaseInstrument, HDAWG, PQSC, SHFQA, SHFQC, SHFSG, UHFLI, UHFQA
+    ]
+else:
+    # DeviceType is only used in annotations. At runtime the common base class
+    # is used so that the drivers do not need to be imported.
+    DeviceType = ZIBaseInstrument
+
+_DRIVER_MODULES = {
+    "SHFQA": "zhinst.qcodes.driver.devices.shfqa",
+    "SHFQC": "zhinst.qcodes.driver.devices.shfqc",
+    "SHFSG": "zhinst.qcodes.driver.devices.shfsg",
+    "HDAWG": "zhinst.qcodes.driver.devices.hdawg",
+    "PQSC": "zhinst.qcodes.driver.devices.pqsc",
+    "UHFQA": "zhinst.qcodes.driver.devices.uhfqa",
+    "UHFLI": "zhinst.qcodes.driver.devices.uhfli",
 }
 
+
+class _DeviceClassByModel(Mapping):
+    """Mapping from the device model to its driver class.
+
+    The driver module of a model is imported on the first access.
+    """
+
+    def __getitem__(self, model: str) -> t.Type[ZIBaseInstrument]:
+        if model not in _DRIVER_MODULES:
+            raise KeyError(model)
+        return __getattr__(model)
+
+    def __contains__(self, model: object) -> bool:
+        return model in _DRIVER_MODULES
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(_DRIVER_MODULES)
+
+    def __len__(self) -> int:
+        return len(_DRIVER_MODULES)
+
+
+DEVICE_CLASS_BY_MODEL: t.Mapping[str, t.Type[ZIBaseInstrument]] = _DeviceClassByModel()
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the device specific drivers on first access."""
+    if name not in _DRIVER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    driver = getattr(importlib.import_module(_DRIVER_MODULES[name]), name)
+    globals()[name] = driver
+    return driver
+
+
+def __dir__() -> t.List[str]:
+    """List the module attributes including the not yet imported drivers."""
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "DeviceType",
     "DEVICE_CLASS_BY_MODEL",
@@ -1,14 +1,18 @@
 """Base modules for the Zurich Instrument specific QCoDeS driver."""
 import typing as t
+from functools import cached_property
 
 from zhinst.toolkit.driver.devices import DeviceType
 
-from zhinst.qcodes.qcodes_adaptions import init_nodetree, ZIInstrument
+from zhinst.qcodes.qcodes_adaptions import init_nodetree, ZIInstrument, ZIParameter
 
 if t.TYPE_CHECKING:
     from zhinst.qcodes.session import ZISession, Session
     from qcodes.instrument.base import Instrument
 
+# Prefix of the default instrument name for each toolkit device class.
+_NAME_PREFIXES: t.Dict[type, str] = {}
+
 
 class ZIBaseInstrument(ZIInstrument):
     """Generic QCoDeS driver for a Zurich Instrument device.
@@ -35,10 +39,15 @@ class ZIBaseInstrument(ZIInstrument):
     ):
         self._tk_object = tk_object
         self._session = session
+        self._idn: t.Optional[t.Dict[str, t.Optional[str]]] = None
+        self._is_compatible = False
         if not name:
-            name = (
-                f"zi_{tk_object.__class__.__name__.lower()}_{tk_object.serial.lower()}"
-            )
+            device_class = tk_object.__class__
+            prefix = _NAME_PREFIXES.get(device_class)
+            if prefix is None:
+                prefix = f"zi_{device_class.__name__.lower()}_"
+                _NAME_PREFIXES[device_class] = prefix
+            name = prefix + tk_object.serial.lower()
         super().__init__(name, self._tk_object.root)
 
         if not raw:
@@ -46,13 +55,19 @@ class ZIBaseInstrument(ZIInstrument):
         init_nodetree(self, self._tk_object.root, self._snapshot_cache)
 
     def get_idn(self) -> t.Dict[str, t.Optional[str]]:
-        """Fake a standard VISA ``*IDN?`` response."""
-        return {
-            "vendor": "Zurich Instruments",
-            "model": self.device_type,
-            "serial": self.serial,
-            "firmware": self.system.fwrevision(),
-        }
+        """Fake a standard VISA ``*IDN?`` response.
+
+        The response is read from the device only once and cached afterwards,
+        since none of the values can change while the device is connected.
+        """
+        if self._idn is None:
+            self._idn = {
+                "vendor": "Zurich Instruments",
+                "model": self.device_type,
+                "serial": self.serial,
+                "firmware": self.system.fwrevision(),
+            }
+        return dict(self._idn)
 
     def _init_additional_nodes(self) -> None:
         """Init additional qcodes parameter."""
@@ -65,6 +80,7 @@ class ZIBaseInstrument(ZIInstrument):
                 should be performed between the device and the data
                 server after loading the factory preset (default: True).
         """
+        self._idn = None
         return self._tk_object.factory_reset(deep=deep)
 
     def check_compatibility(self) -> None:
@@ -78,12 +94,16 @@ class ZIBaseInstrument(ZIInstrument):
         * zhinst package matches the LabOne Data Server version
         * firmware revision matches the LabOne Data Server version
 
+        Once the check passed it is not repeated for this instance.
+
         Raises:
             ConnectionError: If the device is currently updating
             RuntimeError: If one of the above mentioned criteria is not
                 fulfilled
         """
-        self._tk_object.check_compatibility
+        if not self._is_compatible:
+            self._tk_object.check_compatibility()
+            self._is_compatible = True
 
     def get_streamingnodes(self) -> list:
         """Create a dictionary with all streaming nodes available."""
@@ -111,12 +131,72 @@ class ZIBaseInstrument(ZIInstrument):
         """
         return self._tk_object.set_transaction()
 
-    @property
+    def set_many(self, values: t.Mapping[t.Union[ZIParameter, str], t.Any]) -> None:
+        """Set multiple nodes within a single transaction.
+
+        Shortcut for setting many nodes inside ``set_transaction``. All values
+        are sent to the data server in a single command.
+
+        Like with any transactional set a get directly after this function
+        may still return the previous values. Use ``sync`` if the following
+        code relies on the new values being applied.
+
+        Args:
+            values: Mapping of node to value. The node can either be the
+                QCoDeS parameter or the node path relative to the device
+                (e.g. ``"sigouts/0/on"``).
+
+        Raises:
+            KeyError: If a node path does not exist on the device. In that
+                case no value is set.
+
+        Examples:
+            >>> device.set_many(
+                    {
+                        device.sigouts[0].on: 1,
+                        "sigouts/1/on": 1,
+                    }
+                )
+        """
+        nodes = []
+        for node, value in values.items():
+            if not isinstance(node, ZIParameter):
+                tk_node = self._tk_object[node]
+                if not tk_node.is_valid():
+                    raise KeyError(
+                        f"{node!r} is not a node of the device {self.serial}."
+                    )
+                node = tk_node
+            nodes.append((node, value))
+        with self.set_transaction():
+            for node, value in nodes:
+                node(value)
+
+    def sync(self) -> None:
+        """Synchronize the data server with the device.
+
+        A normal set command returns as soon as the data server has accepted
+        it, without waiting for the device to acknowledge the new value.
+        This makes configuring many nodes fast but a get directly after such
+        a set may still return the old value. Calling ``sync`` once at the end
+        of a configuration block acts as a barrier: all pending set commands
+        are flushed to the device before the function returns.
+
+        Use the ``deep`` flag of a parameter (``device.sigouts[0].on(1,
+        deep=True)``) instead if only a single set needs to be blocking.
+
+        Warning:
+            The sync is performed for all devices connected to the data server
+            of this device.
+        """
+        self._session.sync()
+
+    @cached_property
     def serial(self) -> str:
         """Instrument specific serial."""
         return self._tk_object.serial
 
-    @property
+    @cached_property
     def device_type(self) -> str:
         """Type of the instrument (e.g. MFLI)."""
         return self._tk_object.device_type
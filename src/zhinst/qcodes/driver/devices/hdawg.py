@@ -116,14 +116,15 @@ class AWG(ZINode):
             self, parent, f"awg_{index}", snapshot_cache=snapshot_cache, zi_node=zi_node
         )
         self._tk_object = tk_object
-        if self._tk_object.commandtable:
+        commandtable = self._tk_object.commandtable
+        if commandtable is not None:
 
             self.add_submodule(
                 "commandtable",
                 CommandTableNode(
                     self,
-                    self._tk_object.commandtable,
-                    zi_node=self._tk_object.commandtable.node_info.path,
+                    commandtable,
+                    zi_node=commandtable.node_info.path,
                     snapshot_cache=self._snapshot_cache,
                 ),
             )
@@ -298,22 +299,23 @@ class HDAWG(ZIBaseInstrument):
 
     def _init_additional_nodes(self):
         """Init class specific modules and parameters."""
-        if self._tk_object.awgs:
+        awgs = self._tk_object.awgs
+        if awgs:
 
             channel_list = ZIChannelList(
                 self,
                 "awgs",
                 AWG,
-                zi_node=self._tk_object.awgs.node_info.path,
+                zi_node=awgs.node_info.path,
                 snapshot_cache=self._snapshot_cache,
             )
-            for i, x in enumerate(self._tk_object.awgs):
+            for i, x in enumerate(awgs):
                 channel_list.append(
                     AWG(
                         self,
                         x,
                         i,
-                        zi_node=self._tk_object.awgs[i].node_info.path,
+                        zi_node=x.node_info.path,
                         snapshot_cache=self._snapshot_cache,
                     )
                 )
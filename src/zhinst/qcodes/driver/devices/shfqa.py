@@ -262,22 +262,23 @@ class MultiState(ZINode):
             self, parent, "multistate", snapshot_cache=snapshot_cache, zi_node=zi_node
         )
         self._tk_object = tk_object
-        if self._tk_object.qudits:
+        qudits = self._tk_object.qudits
+        if qudits:
 
             channel_list = ZIChannelList(
                 self,
                 "qudits",
                 Qudit,
-                zi_node=self._tk_object.qudits.node_info.path,
+                zi_node=qudits.node_info.path,
                 snapshot_cache=self._snapshot_cache,
             )
-            for i, x in enumerate(self._tk_object.qudits):
+            for i, x in enumerate(qudits):
                 channel_list.append(
                     Qudit(
                         self,
                         x,
                         i,
-                        zi_node=self._tk_object.qudits[i].node_info.path,
+                        zi_node=x.node_info.path,
                         snapshot_cache=self._snapshot_cache,
                     )
                 )
@@ -316,14 +317,15 @@ class Readout(ZINode):
             self, parent, "readout", snapshot_cache=snapshot_cache, zi_node=zi_node
         )
         self._tk_object = tk_object
-        if self._tk_object.multistate:
+        multistate = self._tk_object.multistate
+        if multistate:
 
             self.add_submodule(
                 "multistate",
                 MultiState(
                     self,
-                    self._tk_object.multistate,
-                    zi_node=self._tk_object.multistate.node_info.path,
+                    multistate,
+                    zi_node=multistate.node_info.path,
                     snapshot_cache=self._snapshot_cache,
                 ),
             )
@@ -543,38 +545,41 @@ class QAChannel(ZINode):
             zi_node=zi_node,
         )
         self._tk_object = tk_object
-        if self._tk_object.generator:
+        generator = self._tk_object.generator
+        if generator:
 
             self.add_submodule(
                 "generator",
                 Generator(
                     self,
-                    self._tk_object.generator,
-                    zi_node=self._tk_object.generator.node_info.path,
+                    generator,
+                    zi_node=generator.node_info.path,
                     snapshot_cache=self._snapshot_cache,
                 ),
             )
 
-        if self._tk_object.readout:
+        readout = self._tk_object.readout
+        if readout:
 
             self.add_submodule(
                 "readout",
                 Readout(
                     self,
-                    self._tk_object.readout,
-                    zi_node=self._tk_object.readout.node_info.path,
+                    readout,
+                    zi_node=readout.node_info.path,
                     snapshot_cache=self._snapshot_cache,
                 ),
             )
 
-        if self._tk_object.spectroscopy:
+        spectroscopy = self._tk_object.spectroscopy
+        if spectroscopy:
 
             self.add_submodule(
                 "spectroscopy",
                 Spectroscopy(
                     self,
-                    self._tk_object.spectroscopy,
-                    zi_node=self._tk_object.spectroscopy.node_info.path,
+                    spectroscopy,
+                    zi_node=spectroscopy.node_info.path,
                     snapshot_cache=self._snapshot_cache,
                 ),
             )
@@ -746,44 +751,46 @@ class SHFQA(ZIBaseInstrument):
 
     def _init_additional_nodes(self):
         """Init class specific modules and parameters."""
-        if self._tk_object.qachannels:
+        qachannels = self._tk_object.qachannels
+        if qachannels:
 
             channel_list = ZIChannelList(
                 self,
                 "qachannels",
                 QAChannel,
-                zi_node=self._tk_object.qachannels.node_info.path,
+                zi_node=qachannels.node_info.path,
                 snapshot_cache=self._snapshot_cache,
             )
-            for i, x in enumerate(self._tk_object.qachannels):
+            for i, x in enumerate(qachannels):
                 channel_list.append(
                     QAChannel(
                         self,
                         x,
                         i,
-                        zi_node=self._tk_object.qachannels[i].node_info.path,
+                        zi_node=x.node_info.path,
                         snapshot_cache=self._snapshot_cache,
                     )
                 )
             # channel_list.lock()
             self.add_submodule("qachannels", channel_list)
 
-        if self._tk_object.scopes:
+        scopes = self._tk_object.scopes
+        if scopes:
 
             channel_list = ZIChannelList(
                 self,
                 "scopes",
                 SHFScope,
-                zi_node=self._tk_object.scopes.node_info.path,
+                zi_node=scopes.node_info.path,
                 snapshot_cache=self._snapshot_cache,
             )
-            for i, x in enumerate(self._tk_object.scopes):
+            for i, x in enumerate(scopes):
                 channel_list.append(
                     SHFScope(
                         self,
                         x,
                         i,
-                        zi_node=self._tk_object.scopes[i].node_info.path,
+                        zi_node=x.node_info.path,
                         snapshot_cache=self._snapshot_cache,
                     )
                 )
@@ -102,14 +102,15 @@ class AWGCore(ZINode):
             self, parent, "awg", snapshot_cache=snapshot_cache, zi_node=zi_node
         )
         self._tk_object = tk_object
-        if self._tk_object.commandtable:
+        commandtable = self._tk_object.commandtable
+        if commandtable is not None:
 
             self.add_submodule(
                 "commandtable",
                 CommandTableNode(
                     self,
-                    self._tk_object.commandtable,
-                    zi_node=self._tk_object.commandtable.node_info.path,
+                    commandtable,
+                    zi_node=commandtable.node_info.path,
                     snapshot_cache=self._snapshot_cache,
                 ),
             )
@@ -337,14 +338,15 @@ class SGChannel(ZINode):
             zi_node=zi_node,
         )
         self._tk_object = tk_object
-        if self._tk_object.awg:
+        awg = self._tk_object.awg
+        if awg:
 
             self.add_submodule(
                 "awg",
                 AWGCore(
                     self,
-                    self._tk_object.awg,
-                    zi_node=self._tk_object.awg.node_info.path,
+                    awg,
+                    zi_node=awg.node_info.path,
                     snapshot_cache=self._snapshot_cache,
                 ),
             )
@@ -459,22 +461,23 @@ class SHFSG(ZIBaseInstrument):
 
     def _init_additional_nodes(self):
         """Init class specific modules and parameters."""
-        if self._tk_object.sgchannels:
+        sgchannels = self._tk_object.sgchannels
+        if sgchannels:
 
             channel_list = ZIChannelList(
                 self,
                 "sgchannels",
                 SGChannel,
-                zi_node=self._tk_object.sgchannels.node_info.path,
+                zi_node=sgchannels.node_info.path,
                 snapshot_cache=self._snapshot_cache,
             )
-            for i, x in enumerate(self._tk_object.sgchannels):
+            for i, x in enumerate(sgchannels):
                 channel_list.append(
                     SGChannel(
                         self,
                         x,
                         i,
-                        zi_node=self._tk_object.sgchannels[i].node_info.path,
+                        zi_node=x.node_info.path,
                         snapshot_cache=self._snapshot_cache,
                     )
                 )
@@ -2,8 +2,9 @@
 from typing import Union, Optional, List, Dict, Any, Tuple
 import numpy as np
 from zhinst.toolkit import CommandTable, Waveforms, Sequence
+from zhinst.toolkit.nodetree.helper import create_or_append_set_transaction
 from zhinst.qcodes.driver.devices.base import ZIBaseInstrument
-from zhinst.qcodes.qcodes_adaptions import ZINode, ZIChannelList
+from zhinst.qcodes.qcodes_adaptions import ZINode, ZIChannelList, NodeDict
 
 
 class CommandTableNode(ZINode):
@@ -117,14 +118,15 @@ class AWG(ZINode):
             self, parent, f"awg_{index}", snapshot_cache=snapshot_cache, zi_node=zi_node
         )
         self._tk_object = tk_object
-        if self._tk_object.commandtable:
+        commandtable = self._tk_object.commandtable
+        if commandtable is not None:
 
             self.add_submodule(
                 "commandtable",
                 CommandTableNode(
                     self,
-                    self._tk_object.commandtable,
-                    zi_node=self._tk_object.commandtable.node_info.path,
+                    commandtable,
+                    zi_node=commandtable.node_info.path,
                     snapshot_cache=self._snapshot_cache,
                 ),
             )
@@ -350,39 +352,19 @@ class QAS(ZINode):
             self, parent, f"qas_{index}", snapshot_cache=snapshot_cache, zi_node=zi_node
         )
         self._tk_object = tk_object
-        if self._tk_object.integration:
+        integration = self._tk_object.integration
+        if integration:
 
             self.add_submodule(
                 "integration",
                 Integration(
                     self,
-                    self._tk_object.integration,
-                    zi_node=self._tk_object.integration.node_info.path,
+                    integration,
+                    zi_node=integration.node_info.path,
                     snapshot_cache=self._snapshot_cache,
                 ),
             )
 
-    def crosstalk_matrix(self, matrix: np.ndarray = None) -> Optional[np.ndarray]:
-        """Sets or gets the crosstalk matrix of the UHFQA as a 2D array.
-
-        Args:
-            matrix: The 2D matrix used in the digital signal
-                processing path to compensate for crosstalk between the
-                different channels. The given matrix can also be a part
-                of the entire 10 x 10 matrix. Its maximum dimensions
-                are 10 x 10 (default: None).
-
-        Returns:
-            If no argument is given the method returns the current
-            crosstalk matrix as a 2D numpy array.
-
-        Raises:
-            ValueError: If the matrix size exceeds the maximum size of
-                10 x 10
-
-        """
-        return self._tk_object.crosstalk_matrix(matrix=matrix)
-
     def adjusted_delay(self, value: int = None) -> int:
         """Set or get the adjustment in the quantum analyzer delay.
 
@@ -408,50 +390,100 @@ class QAS(ZINode):
         """
         return self._tk_object.adjusted_delay(value=value)
 
+    def crosstalk_matrix(self, matrix: np.ndarray = None) -> Optional[np.ndarray]:
+        """Sets or gets the crosstalk matrix of the UHFQA as a 2D array.
+
+        Args:
+            matrix: The 2D matrix used in the digital signal
+                processing path to compensate for crosstalk between the
+                different channels. The given matrix can also be a part
+                of the entire 10 x 10 matrix. Its maximum dimensions
+                are 10 x 10 (default: None).
+
+        Returns:
+            If no argument is given the method returns the current
+            crosstalk matrix as a 2D numpy array.
+
+        Raises:
+            ValueError: If the matrix size exceeds the maximum size of
+                10 x 10 or contains non finite values.
+
+        """
+        if matrix is None:
+            return self._tk_object.crosstalk_matrix()
+        matrix = np.asarray(matrix)
+        if matrix.ndim != 2 or matrix.shape[0] > 10 or matrix.shape[1] > 10:
+            raise ValueError(
+                "The crosstalk matrix must be 2D with a maximum size of 10 x 10 "
+                f"(got shape {matrix.shape})."
+            )
+        if not np.isfinite(matrix).all():
+            raise ValueError("The crosstalk matrix must only contain finite values.")
+        # All elements are written in a single transaction to avoid
+        # a partially updated matrix and one round trip per element.
+        with create_or_append_set_transaction(self._tk_object.root):
+            return self._tk_object.crosstalk_matrix(matrix=matrix)
+
+    def read_results(self) -> NodeDict:
+        """Read the result vectors of all readout channels at once.
+
+        Instead of fetching every ``result.data[i].wave`` node separately all
+        result vectors are requested with a single wildcard get from the data
+        server.
+
+        Returns:
+            Result vectors. The data can be accessed either with the node
+            string or with the corresponding QCoDeS parameter, e.g.
+            ``results[device.qas[0].result.data[2].wave]``.
+        """
+        return NodeDict(self._tk_object.result.data["*"].wave(settingsonly=False))
+
 
 class UHFQA(ZIBaseInstrument):
     """QCoDeS driver for the Zurich Instruments UHFQA."""
 
     def _init_additional_nodes(self):
         """Init class specific modules and parameters."""
-        if self._tk_object.awgs:
+        awgs = self._tk_object.awgs
+        if awgs:
 
             channel_list = ZIChannelList(
                 self,
                 "awgs",
                 AWG,
-                zi_node=self._tk_object.awgs.node_info.path,
+                zi_node=awgs.node_info.path,
                 snapshot_cache=self._snapshot_cache,
             )
-            for i, x in enumerate(self._tk_object.awgs):
+            for i, x in enumerate(awgs):
                 channel_list.append(
                     AWG(
                         self,
                         x,
                         i,
-                        zi_node=self._tk_object.awgs[i].node_info.path,
+                        zi_node=x.node_info.path,
                         snapshot_cache=self._snapshot_cache,
                     )
                 )
             # channel_list.lock()
             self.add_submodule("awgs", channel_list)
 
-        if self._tk_object.qas:
+        qas = self._tk_object.qas
+        if qas:
 
             channel_list = ZIChannelList(
                 self,
                 "qas",
                 QAS,
-                zi_node=self._tk_object.qas.node_info.path,
+                zi_node=qas.node_info.path,
                 snapshot_cache=self._snapshot_cache,
             )
-            for i, x in enumerate(self._tk_object.qas):
+            for i, x in enumerate(qas):
                 channel_list.append(
                     QAS(
                         self,
                         x,
                         i,
-                        zi_node=self._tk_object.qas[i].node_info.path,
+                        zi_node=x.node_info.path,
                         snapshot_cache=self._snapshot_cache,
                     )
                 )
@@ -1,29 +1,69 @@
-"""Module for toolkit representations of native LabOne modules."""
+"""Module for toolkit representations of native LabOne modules.
+
+The module specific classes are only imported once they are accessed.
+"""
+import importlib
 import typing as t
 
 from zhinst.qcodes.driver.modules.base_module import ZIBaseModule
-from zhinst.qcodes.driver.modules.daq_module import ZIDAQModule
-from zhinst.qcodes.driver.modules.device_settings_module import ZIDeviceSettingsModule
-from zhinst.qcodes.driver.modules.impedance_module import ZIImpedanceModule
-from zhinst.qcodes.driver.modules.pid_advisor_module import ZIPIDAdvisorModule
-from zhinst.qcodes.driver.modules.precompensation_advisor_module import (
-    ZIPrecompensationAdvisorModule,
-)
-from zhinst.qcodes.driver.modules.scope_module import ZIScopeModule
-from zhinst.qcodes.driver.modules.shfqa_sweeper import ZISHFQASweeper
-from zhinst.qcodes.driver.modules.sweeper_module import ZISweeperModule
-
-ModuleType = t.Union[
-    ZIBaseModule,
-    ZIDAQModule,
-    ZIDeviceSettingsModule,
-    ZIImpedanceModule,
-    ZIPIDAdvisorModule,
-    ZIPrecompensationAdvisorModule,
-    ZIScopeModule,
-    ZISHFQASweeper,
-    ZISweeperModule,
-]
+
+if t.TYPE_CHECKING:
+    from zhinst.qcodes.driver.modules.daq_module import ZIDAQModule
+    from zhinst.qcodes.driver.modules.device_settings_module import (
+        ZIDeviceSettingsModule,
+    )
+    from zhinst.qcodes.driver.modules.impedance_module import ZIImpedanceModule
+    from zhinst.qcodes.driver.modules.pid_advisor_module import ZIPIDAdvisorModule
+    from zhinst.qcodes.driver.modules.precompensation_advisor_module import (
+        ZIPrecompensationAdvisorModule,
+    )
+    from zhinst.qcodes.driver.modules.scope_module import ZIScopeModule
+    from zhinst.qcodes.driver.modules.shfqa_sweeper import ZISHFQASweeper
+    from zhinst.qcodes.driver.modules.sweeper_module import ZISweeperModule
+
+    ModuleType = t.Union[
+        ZIBaseModule,
+        ZIDAQModule,
+        ZIDeviceSettingsModule,
+        ZIImpedanceModule,
+        ZIPIDAdvisorModule,
+        ZIPrecompensationAdvisorModule,
+        ZIScopeModule,
+        ZISHFQASweeper,
+        ZISweeperModule,
+    ]
+else:
+    # ModuleType is only used in annotations. At runtime the common base class
+    # is used so that the modules do not need to be imported.
+    ModuleType = ZIBaseModule
+
+_MODULE_CLASSES = {
+    "ZIDAQModule": "zhinst.qcodes.driver.modules.daq_module",
+    "ZIDeviceSettingsModule": "zhinst.qcodes.driver.modules.device_settings_module",
+    "ZIImpedanceModule": "zhinst.qcodes.driver.modules.impedance_module",
+    "ZIPIDAdvisorModule": "zhinst.qcodes.driver.modules.pid_advisor_module",
+    "ZIPrecompensationAdvisorModule": (
+        "zhinst.qcodes.driver.modules.precompensation_advisor_module"
+    ),
+    "ZIScopeModule": "zhinst.qcodes.driver.modules.scope_module",
+    "ZISHFQASweeper": "zhinst.qcodes.driver.modules.shfqa_sweeper",
+    "ZISweeperModule": "zhinst.qcodes.driver.modules.sweeper_module",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    """Import the module specific classes on first access."""
+    if name not in _MODULE_CLASSES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_class = getattr(importlib.import_module(_MODULE_CLASSES[name]), name)
+    globals()[name] = module_class
+    return module_class
+
+
+def __dir__() -> t.List[str]:
+    """List the module attributes including the not yet imported classes."""
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "ModuleType",
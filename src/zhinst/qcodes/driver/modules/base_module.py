@@ -10,6 +10,7 @@ from zhinst.qcodes.qcodes_adaptions import (
     NodeDict,
     ZIInstrument,
     init_nodetree,
+    module_instance_name,
     tk_node_to_parameter,
 )
 
@@ -37,15 +38,14 @@ class ZIBaseModule(ZIInstrument):
     def __init__(self, tk_object: TKModuleType, session: "Session", name: str):
         self._tk_object = tk_object
         self._session = session
-        super().__init__(
-            f"zi_{name}_{len(self.instances())}", tk_object.root, is_module=True
-        )
+        self._node_cache: t.Dict[str, t.Tuple["DeviceType", ZIParameter]] = {}
+        super().__init__(module_instance_name(name), tk_object.root, is_module=True)
         init_nodetree(self, self._tk_object, self._snapshot_cache)
 
         self._tk_object.root.update_nodes(
             {
                 "/device": {
-                    "GetParser": lambda value: self._get_device(value),
+                    "GetParser": self._get_device,
                 }
             },
             raise_for_invalid_node=False,
@@ -54,6 +54,9 @@ class ZIBaseModule(ZIInstrument):
     def _get_device(self, serial: str) -> t.Union["DeviceType", str]:
         """Convert a device serial into a QCoDeS device object.
 
+        Device objects that were already created are returned without a
+        request to the data server.
+
         Args:
             serial: Serial of the device
 
@@ -61,6 +64,9 @@ class ZIBaseModule(ZIInstrument):
             QCoDeS device object. If the serial does not
                 match to a connected device the serial is returned instead.
         """
+        device = self._session.devices._get_registered(serial)
+        if device is not None:
+            return device
         try:
             return self._session.devices[serial]
         except (RuntimeError, KeyError):
@@ -69,6 +75,9 @@ class ZIBaseModule(ZIInstrument):
     def _get_node(self, node: str) -> t.Union[ZIParameter, str]:
         """Convert a raw node string into a qcodes node.
 
+        The converted nodes are cached as long as their device is connected
+        through the session.
+
         Args:
             node (str): raw node string
 
@@ -76,11 +85,19 @@ class ZIBaseModule(ZIInstrument):
             Node: qcodes node. (if the node can not be converted the raw node
                 string is returned)
         """
+        cached = self._node_cache.get(node)
+        if cached is not None and self._session.devices._is_registered(cached[0]):
+            return cached[1]
         tk_node = self._tk_object._get_node(node)
         if isinstance(tk_node, str):
             return tk_node
-        device = self._session.devices[tk_node.root.prefix_hide]
-        return tk_node_to_parameter(device, tk_node)
+        serial = tk_node.root.prefix_hide
+        device = self._session.devices._get_registered(serial)
+        if device is None:
+            device = self._session.devices[serial]
+        parameter = tk_node_to_parameter(device, tk_node)
+        self._node_cache[node] = (device, parameter)
+        return parameter
 
     @staticmethod
     def _set_node(signal: t.Union[ZIParameter, TKNode, str]) -> str:
@@ -98,31 +115,53 @@ class ZIBaseModule(ZIInstrument):
             node = TKBaseModule._set_node(signal)
         return node
 
-    def subscribe(self, signal: t.Union[ZIParameter, str]):
+    def subscribe(
+        self,
+        signal: t.Union[ZIParameter, str, t.Sequence[t.Union[ZIParameter, str]]],
+    ):
         """Subscribe to a node.
 
         The node can either be a node of this module or of a connected device.
+        Multiple nodes can be subscribed in a single call by passing a list.
 
         Args:
-            signal (Node): node that should be subscribed.
-        """
-        try:
-            self._tk_object.subscribe(signal.zi_node)  # type: ignore[union-attr]
-        except AttributeError:
-            self._tk_object.subscribe(signal)
+            signal (Node): node or list of nodes that should be subscribed.
 
-    def unsubscribe(self, signal: t.Union[ZIParameter, str]):
+        .. versionchanged:: 0.6.1
+
+            Accept a list of nodes.
+        """
+        if isinstance(signal, (list, tuple)):
+            self._tk_object.raw_module.subscribe([self._set_node(x) for x in signal])
+        else:
+            try:
+                self._tk_object.subscribe(signal.zi_node)  # type: ignore[union-attr]
+            except AttributeError:
+                self._tk_object.subscribe(signal)
+
+    def unsubscribe(
+        self,
+        signal: t.Union[ZIParameter, str, t.Sequence[t.Union[ZIParameter, str]]],
+    ):
         """Unsubscribe from a node.
 
         The node can either be a node of this module or of a connected device.
+        Multiple nodes can be unsubscribed in a single call by passing a list.
 
         Args:
-            signal (Node): node that should be unsubscribe.
+            signal (Node): node or list of nodes that should be unsubscribe.
+
+        .. versionchanged:: 0.6.1
+
+            Accept a list of nodes.
         """
-        try:
-            self._tk_object.unsubscribe(signal.zi_node)  # type: ignore[union-attr]
-        except AttributeError:
-            self._tk_object.unsubscribe(signal)
+        if isinstance(signal, (list, tuple)):
+            self._tk_object.raw_module.unsubscribe([self._set_node(x) for x in signal])
+        else:
+            try:
+                self._tk_object.unsubscribe(signal.zi_node)  # type: ignore[union-attr]
+            except AttributeError:
+                self._tk_object.unsubscribe(signal)
 
     @property
     def raw_module(self) -> ZIModule:  # type: ignore [type-var]
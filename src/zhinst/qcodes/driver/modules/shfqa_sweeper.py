@@ -3,7 +3,11 @@ import typing as t
 
 from zhinst.toolkit.driver.modules.shfqa_sweeper import SHFQASweeper as TKSHFQASweeper
 
-from zhinst.qcodes.qcodes_adaptions import init_nodetree, ZIInstrument
+from zhinst.qcodes.qcodes_adaptions import (
+    init_nodetree,
+    module_instance_name,
+    ZIInstrument,
+)
 
 if t.TYPE_CHECKING:
     from zhinst.qcodes.driver.devices import DeviceType
@@ -41,18 +45,19 @@ class ZISHFQASweeper(ZIInstrument):
 
     def __init__(self, tk_object: TKSHFQASweeper, session: "Session"):
         super().__init__(
-            f"zi_shfqasweeper_{len(self.instances())}", tk_object.root, is_module=True
+            module_instance_name("shfqasweeper"), tk_object.root, is_module=True
         )
         self._tk_object = tk_object
         self._session = session
         init_nodetree(self, self._tk_object, self._snapshot_cache)
-        self._tk_object.root.update_nodes(
-            {"/device": {"GetParser": lambda value: self._get_device(value)}}
-        )
+        self._tk_object.root.update_nodes({"/device": {"GetParser": self._get_device}})
 
     def _get_device(self, serial: str) -> t.Union["DeviceType", str]:
         """Convert a device serial into a QCoDeS device object.
 
+        Device objects that were already created are returned without a
+        request to the data server.
+
         Args:
             serial: Serial of the device
 
@@ -60,6 +65,9 @@ class ZISHFQASweeper(ZIInstrument):
             QCoDeS device object. If the serial does not
                 match to a connected device the serial is returned instead.
         """
+        device = self._session.devices._get_registered(serial)
+        if device is not None:
+            return device
         try:
             return self._session.devices[serial]
         except (RuntimeError, KeyError):
@@ -1,9 +1,11 @@
 """Base modules for the Zurich Instrument specific QCoDeS driver."""
 
+import itertools
 import re
 from datetime import datetime
 import typing as t
-from contextlib import contextmanager, nullcontext
+from contextlib import nullcontext
+from collections import defaultdict
 from collections.abc import Mapping
 
 import numpy as np
@@ -15,6 +17,19 @@ from zhinst.toolkit.nodetree import Node, NodeTree
 from zhinst.toolkit.nodetree.helper import NodeDict as TKNodeDict
 from zhinst.toolkit.nodetree.node import NodeInfo
 
+# Nodes that end with a digit but are not part of a channel list.
+_NON_CHANNEL_NODES = frozenset(("tamp0", "tamp1"))
+# Units reported by LabOne that do not correspond to a physical unit.
+_IGNORED_UNITS = frozenset(("None", "Dependent"))
+# Nodes that are excluded from the snapshot, including all their subnodes.
+_SNAPSHOT_BLACKLIST = frozenset(("fwlog", "values"))
+# Types of the values returned by the data server that are converted with item().
+_NUMPY_TYPES = (np.generic, np.ndarray)
+# Nodes that hold complex numbers.
+_COMPLEX_NODE = re.compile("demods/./sample", re.IGNORECASE)
+# Number of the next QCoDeS instance of a LabOne module by module name.
+_MODULE_COUNTERS: t.DefaultDict[str, t.Iterator[int]] = defaultdict(itertools.count)
+
 
 class ZISnapshotHelper:
     """Helper class for the snapshot with Zurich Instrument devices.
@@ -31,31 +46,70 @@ class ZISnapshotHelper:
         self._nodetree = nodetree
         self._is_module = is_module
 
-    @contextmanager
-    def snapshot(self, name: t.Optional[str] = None):
+    def snapshot(self, name: t.Optional[str] = None) -> "_SnapshotContext":
         """Context manager for a optimized snapshot with ZI devices."""
-        is_owner = not self._is_running
-        if is_owner:
-            self._start_snapshot(name)
-        try:
-            yield
-        finally:
-            if is_owner:
-                self._stop_snapshot()
+        return _SnapshotContext(self, name)
+
+    def batch(self, names: t.Iterable[str]) -> "_SnapshotContext":
+        """Context manager for a snapshot of multiple subnodes.
+
+        The values of all subnodes are fetched with a single get to the device.
+        Snapshots taken within the context reuse these values. Nodes outside
+        of the specified subnodes are read with a normal get.
+
+        LabOne modules do not support multiple paths in a single get. For them
+        the values of all nodes of the module are fetched instead.
+
+        Args:
+            names: Names of the subnodes which the snapshot should be taken.
+
+        .. versionadded:: 0.6.1
+        """
+        return _SnapshotContext(self, tuple(names))
 
-    def _start_snapshot(self, name: t.Optional[str] = None) -> bool:
+    def _snapshot_path(self, name: t.Optional[str]) -> str:
+        """Wildcard path that is used to get all nodes of a subnode.
+
+        Args:
+            name: Name of the subnode. If not specified all nodes are used.
+
+        Returns:
+            Wildcard path of the subnode.
+        """
+        prefix = self._nodetree.prefix_hide
+        if not name:
+            name = prefix if prefix else ""
+        elif not name.startswith("/"):
+            # Relative to the (hidden) prefix of the nodetree
+            name = "/" + prefix + "/" + name if prefix else "/" + name
+        return f"{name}/*"
+
+    def _start_snapshot(
+        self, name: t.Union[None, str, t.Tuple[str, ...]] = None
+    ) -> bool:
         """Start a snapshot and make a single get to the device.
 
         Args:
             name: Name of the subnode which the snapshot should
                 be taken. If not specified a snapshot of all nodes will be taken.
-                (default = None)
+                Multiple subnodes can be passed as tuple. (default = None)
 
         Returns:
             bool: Flag if a new snapshot was started.
         """
         if not self._nodetree or self._is_running:
             return False
+        if isinstance(name, tuple):
+            if not name:
+                return False
+            if self._is_module:
+                # The modules only accept a single path, so all nodes are used.
+                path = self._snapshot_path(None)
+            else:
+                # The data server accepts a comma separated list of paths.
+                path = ",".join(self._snapshot_path(x) for x in name)
+        else:
+            path = self._snapshot_path(name)
         self._is_running = True
         if not self._is_module:
             kwargs = {
@@ -66,12 +120,29 @@ class ZISnapshotHelper:
             }
         else:
             kwargs = {"flat": True}
-        prefix = self._nodetree.prefix_hide
-        if not name:
-            name = prefix if prefix else ""
-        else:
-            name = "/" + prefix + "/" + name
-        self._value_dict = self._nodetree.connection.get(f"{name}/*", **kwargs)
+        result = self._nodetree.connection.get(path, **kwargs)
+        # Unwrap the values once so that get only needs a single lookup.
+        self._value_dict = {}
+        for node, node_result in result.items():
+            try:
+                value = node_result["value"][0]
+            except (IndexError, KeyError, TypeError):
+                # HF2 has no timestamp -> no dict
+                try:
+                    value = node_result[0]
+                except (IndexError, KeyError, TypeError):
+                    # Not a single value, get falls back to a normal get
+                    continue
+            # convert numpy types to standart types
+            if isinstance(value, _NUMPY_TYPES):
+                if value.size != 1:
+                    # Array values are read by get with a normal get
+                    continue
+                value = value.item()
+            # convert complex into string
+            if isinstance(value, complex):
+                value = str(value)
+            self._value_dict[node] = value
         self._start = datetime.now()
         return True
 
@@ -80,7 +151,7 @@ class ZISnapshotHelper:
         self._is_running = False
         self._value_dict = {}
 
-    def get(self, parameter: Parameter, fallback_get: t.Callable) -> t.Any:
+    def get(self, parameter: "ZIParameter", fallback_get: t.Callable) -> t.Any:
         """Get the value for a specific QCoDeS Parameter.
 
         Tries to mimic the behavior of a normal get (e.g. update cache).
@@ -93,22 +164,12 @@ class ZISnapshotHelper:
         Returns:
             Value for the Node
         """
-        value = self._value_dict.get(parameter.zi_node.lower())
-        if value is not None:
-            try:
-                value = value["value"][0]
-            except (IndexError, TypeError):
-                # HF2 has no timestamp -> no dict
-                value = value[0]
-            # convert numpy types to standart types
-            value = value.item() if hasattr(value, "item") else value
-            # convert complex into string
-            value = str(value) if isinstance(value, complex) else value
-            parameter.cache._update_with(
-                value=value, raw_value=value, timestamp=self._start
-            )
-        else:  # fallback is normal get
-            value = fallback_get()
+        value = self._value_dict.get(parameter._zi_node_lower)
+        if value is None:  # fallback is normal get
+            return fallback_get()
+        parameter.cache._update_with(
+            value=value, raw_value=value, timestamp=self._start
+        )
         return value
 
     @staticmethod
@@ -143,8 +204,8 @@ class ZISnapshotHelper:
             print(qcodes_object.name + ":")
             print(f"\t{'parameter':<{par_field_len}}: value")
             print("\t" + "-" * (max_chars - 8))
-            for parameter in sorted(snapshot_parameters):
-                parameter = snapshot_parameters[parameter]
+            # The keys are unique, so the parameter dicts are never compared.
+            for _, parameter in sorted(snapshot_parameters.items()):
                 name = parameter["name"]
                 msg = f"\t{name:<{par_field_len}}:"
 
@@ -178,6 +239,39 @@ class ZISnapshotHelper:
         return self._is_running
 
 
+class _SnapshotContext:
+    """Context manager of a snapshot with a ZISnapshotHelper.
+
+    Only the outermost context starts and stops the snapshot. Nested contexts
+    reuse the values of the running snapshot.
+
+    Args:
+        helper: Snapshot helper.
+        name: Name of the subnode which the snapshot should be taken. Multiple
+            subnodes can be passed as tuple.
+    """
+
+    __slots__ = ("_helper", "_name", "_is_owner")
+
+    def __init__(
+        self,
+        helper: ZISnapshotHelper,
+        name: t.Union[None, str, t.Tuple[str, ...]],
+    ):
+        self._helper = helper
+        self._name = name
+        self._is_owner = False
+
+    def __enter__(self) -> None:
+        self._is_owner = not self._helper._is_running
+        if self._is_owner:
+            self._helper._start_snapshot(self._name)
+
+    def __exit__(self, *exc_info) -> None:
+        if self._is_owner:
+            self._helper._stop_snapshot()
+
+
 class ZIParameter(Parameter):
     """Zurich Instrument specific QCoDeS Parameter.
 
@@ -204,7 +298,10 @@ class ZIParameter(Parameter):
         self.set = self._set_zi
         self._snapshot_cache = snapshot_cache
         self._zi_node = zi_node
+        # Key of the node in the results of the data server.
+        self._zi_node_lower = zi_node.lower()
         self._tk_node = tk_node
+        self._node_info: t.Optional[NodeInfo] = None
 
     def __call__(self, *args, **kwargs):
         """Call operator that either gets (empty) or gets the value of a node.
@@ -353,7 +450,11 @@ class ZIParameter(Parameter):
     @property
     def node_info(self) -> NodeInfo:
         """Zurich Instrument node representation of the Parameter."""
-        return self._tk_node.node_info
+        # The node info of a node does not change, toolkit creates a new
+        # object on every access though.
+        if self._node_info is None:
+            self._node_info = self._tk_node.node_info
+        return self._node_info
 
     @property
     def zi_node(self) -> Node:
@@ -523,6 +624,27 @@ class ZIInstrument(Instrument):
         with self._snapshot_cache.snapshot() if update else nullcontext():
             return super().print_readable_snapshot(update, max_chars)
 
+    def snapshot_many(
+        self,
+        nodes: t.Iterable[t.Union[ZINode, ZIChannelList]],
+        update: bool = True,
+    ) -> t.List[dict]:
+        """Snapshot multiple submodules with a single get to the device.
+
+        Args:
+            nodes: Submodules of the instrument.
+            update: Passed to snapshot_base. (default = True)
+
+        Returns:
+            Snapshots of the submodules in the order of ``nodes``.
+
+        .. versionadded:: 0.6.1
+        """
+        nodes = list(nodes)
+        batch = self._snapshot_cache.batch(node._zi_node for node in nodes)
+        with batch if update else nullcontext():
+            return [node.snapshot(update) for node in nodes]
+
 
 class NodeDict(Mapping):
     """Mapping of dictionary structure results.
@@ -542,7 +664,7 @@ class NodeDict(Mapping):
 
     def __getitem__(self, key: t.Union[str, ZIParameter]):
         if isinstance(key, ZIParameter):
-            return self._result[key.zi_node.lower()]
+            return self._result[key._zi_node_lower]
         return self._result[key]
 
     def __iter__(self):
@@ -576,17 +698,15 @@ def tk_node_to_qcodes_list(tk_node: Node) -> t.List[str]:
         name = tk_node.raw_tree[-1]
         # Attributes are not allowed to start with a number (#31)
         name = "_" + name if name[0].isdigit() else name
-    parents = list(parents)
-    numbers = [subnode for subnode in parents if subnode.isdigit()]
-    while numbers:
-        number = numbers.pop()
-        index = parents.index(number)
-        parents[index - 1] = parents[index - 1] + number
-        parents.pop(index)
-        if not numbers:
-            numbers = [subnode for subnode in parents if subnode.isdigit()]
-    parents.append(name)
-    return parents
+    qcodes_list: t.List[str] = []
+    for subnode in parents:
+        if subnode.isdigit() and qcodes_list:
+            # Channel indexes are part of the channel name, e.g. sigouts0
+            qcodes_list[-1] += subnode
+        else:
+            qcodes_list.append(subnode)
+    qcodes_list.append(name)
+    return qcodes_list
 
 
 def tk_node_to_parameter(root: t.Any, tk_node: Node) -> t.Any:
@@ -599,17 +719,36 @@ def tk_node_to_parameter(root: t.Any, tk_node: Node) -> t.Any:
     Returns:
         QCoDeS Parameter that matches the given tk node.
     """
-    qcodes_list = list(tk_node.raw_tree)
-    if qcodes_list[-1].isdigit():
-        qcodes_list.append("value")
+    parents = tk_node.raw_tree
+    name = parents[-1]
+    if name.isdigit():
+        name = "value"
+    else:
+        parents = parents[:-1]
+        # Attributes are not allowed to start with a number (#31)
+        name = "_" + name if name[0].isdigit() else name
     current_layer = root
-    for element in qcodes_list[:-1]:
-        qcodes_list = tk_node_to_qcodes_list(tk_node)
+    for element in parents:
         if element.isdigit():
             current_layer = current_layer[int(element)]
         else:
             current_layer = current_layer.submodules[element]
-    return current_layer.parameters[qcodes_list[-1]]
+    return current_layer.parameters[name]
+
+
+def module_instance_name(name: str) -> str:
+    """Create a unique QCoDeS instrument name for a LabOne module.
+
+    The modules are numbered per name. Numbers are not reused when a module
+    is closed, so the name never collides with a module that is still open.
+
+    Args:
+        name: Name of the module.
+
+    Returns:
+        Instrument name, e.g. *'zi_sweeper_module_0'*.
+    """
+    return f"zi_{name}_{next(_MODULE_COUNTERS[name])}"
 
 
 def _get_submodule(
@@ -627,52 +766,47 @@ def _get_submodule(
     Returns:
         ZINode: direct parent of the node
     """
-    weird_nodes = ["tamp0", "tamp1"]
     current_layer = layer
-    for i, node in enumerate(parents):
-        if node[-1].isdigit() and node not in weird_nodes:
-            offset = 0
-            for char in reversed(node):
-                if char.isdigit():
-                    offset += 1
-                else:
-                    break
-            number = int(node[-offset:])
-            name = node[:-offset]
-            if not current_layer.submodules or name not in current_layer.submodules:
-                # create channel_list
+    # Node path of the current layer. Unlike parents the channel indexes are
+    # separate elements, e.g. ["sigouts", "0"] instead of ["sigouts0"].
+    path: t.List[str] = []
+    for node in parents:
+        if node[-1].isdigit() and node not in _NON_CHANNEL_NODES:
+            name = node.rstrip("0123456789")
+            number = int(node[len(name) :])
+            channel_list = current_layer.submodules.get(name)
+            if channel_list is None:
                 channel_list = ZIChannelList(
                     current_layer,
                     name,
                     ZINode,
-                    zi_node="/".join(parents[:i] + [name]),
+                    zi_node="/".join(path + [name]),
                     snapshot_cache=snapshot_cache,
                 )
                 current_layer.add_submodule(name, channel_list)
-            if len(current_layer.submodules[name]) <= number:
-                # Add new items to list until the required length is reached. (#31)
-                current_length = len(current_layer.submodules[name])
-                for item in range(number - current_length + 1):
-                    module = ZINode(
-                        current_layer,
-                        name + str(current_length + item),
-                        zi_node="/".join(
-                            parents[:i] + [name, str(current_length + item)]
-                        ),
-                        snapshot_cache=snapshot_cache,
-                    )
-                    current_layer.submodules[name].append(module)
-            current_layer = current_layer.submodules[name][number]
+            # Add new items to list until the required length is reached. (#31)
+            for index in range(len(channel_list), number + 1):
+                module = ZINode(
+                    current_layer,
+                    name + str(index),
+                    zi_node="/".join(path + [name, str(index)]),
+                    snapshot_cache=snapshot_cache,
+                )
+                channel_list.append(module)
+            current_layer = channel_list[number]
+            path += [name, str(number)]
         elif node not in current_layer.submodules:
+            path.append(node)
             module = ZINode(
                 current_layer,
                 node,
-                zi_node="/".join(parents[: i + 1]),
+                zi_node="/".join(path),
                 snapshot_cache=snapshot_cache,
             )
             current_layer.add_submodule(node, module)
             current_layer = module
         else:
+            path.append(node)
             current_layer = current_layer.submodules.get(node)
     return current_layer
 
@@ -681,7 +815,7 @@ def init_nodetree(
     layer,
     nodetree: NodeTree,
     snapshot_cache: ZISnapshotHelper,
-    blacklist: tuple = tuple(),
+    blacklist: t.Iterable[str] = (),
 ) -> None:
     """Generate nested qcodes parameter from the device nodetree.
 
@@ -691,45 +825,38 @@ def init_nodetree(
         snapshot_cache: Instance of the SnapshotHelper.
         blacklist: nodes to be blacklisted.
     """
-    snapshot_blacklist = ["fwlog", "values"]
-
-    is_complex = re.compile("demods/./sample")
+    blacklist = frozenset(blacklist)
 
     for node, info in nodetree:
-        if info.get("Node", "") in blacklist:
+        node_path = info.get("Node", "")
+        if blacklist and node_path in blacklist:
             continue
+        properties = info.get("Properties", "")
+        unit = info.get("Unit")
         try:
             qcodes_list = tk_node_to_qcodes_list(node)
             name = qcodes_list[-1]
             parent = _get_submodule(layer, qcodes_list[:-1], snapshot_cache)
             do_snapshot = (
-                "Stream" not in info.get("Properties")
-                and "ZIVector" not in info.get("Type")
-                and "Read" in info.get("Properties")
-                and not any(x in node.raw_tree for x in snapshot_blacklist)
+                "Stream" not in properties
+                and "ZIVector" not in info.get("Type", "")
+                and "Read" in properties
+                and _SNAPSHOT_BLACKLIST.isdisjoint(node.raw_tree)
             )
             name = name + "_" if hasattr(parent, name) else name
             parent.add_parameter(
                 parameter_class=ZIParameter,
                 name=name,
                 docstring=info.get("Description"),
-                unit=(
-                    info.get("Unit")
-                    if info.get("Unit") not in ["None", "Dependent"]
-                    else None
-                ),
+                unit=unit if unit not in _IGNORED_UNITS else None,
                 get_cmd=node._get,
                 set_cmd=node._set,
-                vals=(
-                    ComplexNumbers()
-                    if re.match(is_complex, info.get("Node").lower())
-                    else None
-                ),
+                vals=ComplexNumbers() if _COMPLEX_NODE.match(node_path) else None,
                 snapshot_value=do_snapshot,
                 snapshot_get=do_snapshot,
-                zi_node=info.get("Node"),
+                zi_node=node_path,
                 tk_node=node,
                 snapshot_cache=snapshot_cache,
             )
         except ValueError as e:
-            print(f"Node {info.get('Node')} could not be added as parameter\n", e)
+            print(f"Node {node_path} could not be added as parameter\n", e)
@@ -1,4 +1,5 @@
 """Connection Manager for the LabOne Python API."""
+from __future__ import annotations
 
 from collections.abc import MutableMapping
 from functools import cached_property
@@ -63,6 +64,44 @@ class Devices(MutableMapping):
     def __delitem__(self, key):
         self._devices.pop(key, None)
 
+    def _register(self, device: ZIDevices.DeviceType) -> None:
+        """Register a device object for a device connected through the session.
+
+        In contrast to ``__setitem__`` the list of connected devices is not
+        requested from the data server, since the caller just established the
+        connection.
+
+        Args:
+            device: Device object.
+        """
+        self._devices[device.serial.lower()] = device
+
+    def _get_registered(self, serial: str) -> t.Optional[ZIDevices.DeviceType]:
+        """Get the device object of a serial if it was already created.
+
+        Only the local registry is checked, no request is sent to the data server.
+
+        Args:
+            serial: Serial of the device.
+
+        Returns:
+            Device object or None if no device object exists for the serial.
+        """
+        return self._devices.get(serial.lower())
+
+    def _is_registered(self, device: ZIDevices.DeviceType) -> bool:
+        """Check if a device object is still the registered one for its serial.
+
+        Only the local registry is checked, no request is sent to the data server.
+
+        Args:
+            device: Device object.
+
+        Returns:
+            Flag if the device object is registered.
+        """
+        return self._get_registered(device.serial) is device
+
     def __iter__(self):
         return iter(self.connected())
 
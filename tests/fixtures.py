@@ -1,7 +1,10 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from pathlib import Path
 from zhinst.qcodes import ZISession
+from zhinst.qcodes.driver.devices.base import ZIBaseInstrument
+from zhinst.qcodes.driver.modules import ZIBaseModule
+from zhinst.qcodes.qcodes_adaptions import ZIParameter
 
 
 @pytest.fixture()
@@ -22,3 +25,44 @@ def session(data_dir, mock_connection):
         nodes_json = file.read()
     mock_connection.return_value.listNodesJSON.return_value = nodes_json
     yield ZISession("localhost")
+
+
+@pytest.fixture()
+def tk_device():
+    tk_device = MagicMock()
+    tk_device.serial = "dev1234"
+    tk_device.device_type = "UHFQA"
+    yield tk_device
+
+
+@pytest.fixture()
+def device(tk_device, session):
+    device = ZIBaseInstrument(tk_device, session, name="test_device")
+    yield device
+    device.close()
+
+
+@pytest.fixture()
+def tk_module():
+    yield MagicMock()
+
+
+@pytest.fixture()
+def module(tk_module, session):
+    module = ZIBaseModule(tk_module, session, "test_module")
+    yield module
+    module.close()
+
+
+def add_parameter(device, name, zi_node, layer=None):
+    layer = device if layer is None else layer
+    layer.add_parameter(
+        name,
+        parameter_class=ZIParameter,
+        get_cmd=MagicMock(),
+        set_cmd=MagicMock(return_value=None),
+        zi_node=zi_node,
+        tk_node=MagicMock(),
+        snapshot_cache=device._snapshot_cache,
+    )
+    return layer.parameters[name]
@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_api_all():
     from zhinst.qcodes import (
         ZIDevice,
@@ -13,3 +16,12 @@ def test_api_all():
         MFIA,
         MFLI,
     )
+
+
+def test_invalid_serial():
+    from zhinst.qcodes import HDAWG, ZIDevice
+
+    with pytest.raises(ValueError):
+        ZIDevice("12000", "localhost")
+    with pytest.raises(ValueError):
+        HDAWG("dev 8000", "localhost")
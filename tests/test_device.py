@@ -0,0 +1,107 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fixtures import (
+    mock_connection,
+    data_dir,
+    session,
+    tk_device,
+    device,
+    add_parameter,
+)
+from zhinst.qcodes.qcodes_adaptions import ZINode
+from zhinst.toolkit.nodetree import Node as TKNode
+
+
+def test_sync(session, device):
+    with patch.object(session, "sync") as sync:
+        device.sync()
+    sync.assert_called_once_with()
+
+
+def test_set_many(device, tk_device):
+    calls = []
+    transaction = tk_device.set_transaction.return_value
+    transaction.__enter__.side_effect = lambda: calls.append("start")
+    transaction.__exit__.side_effect = lambda *args: calls.append("end")
+    parameter = add_parameter(device, "on", "/dev1234/sigouts/0/on")
+    parameter.set_raw.side_effect = lambda value: calls.append(("on", value))
+    tk_node = tk_device.__getitem__.return_value
+    tk_node.side_effect = lambda value: calls.append(("sigouts/1/on", value))
+
+    device.set_many({parameter: 1, "sigouts/1/on": 2})
+
+    tk_device.set_transaction.assert_called_once_with()
+    tk_device.__getitem__.assert_called_once_with("sigouts/1/on")
+    assert calls == ["start", ("on", 1), ("sigouts/1/on", 2), "end"]
+
+
+def use_session_nodetree(session, tk_device):
+    nodetree = session.toolkit_session.root
+    tk_device.__getitem__.side_effect = lambda path: TKNode(
+        nodetree, tuple(path.split("/"))
+    )
+
+
+def test_set_many_nodetree(session, device, tk_device, mock_connection):
+    use_session_nodetree(session, tk_device)
+
+    device.set_many({"config/open": 1})
+
+    tk_device.set_transaction.assert_called_once_with()
+    mock_connection.return_value.set.assert_called_once()
+    assert mock_connection.return_value.set.call_args[0][0] == "/zi/config/open"
+
+
+def test_set_many_invalid_node(session, device, tk_device, mock_connection):
+    use_session_nodetree(session, tk_device)
+
+    with pytest.raises(KeyError, match="'config/invalid' is not a node"):
+        device.set_many({"config/open": 1, "config/invalid": 1})
+
+    tk_device.set_transaction.assert_not_called()
+    mock_connection.return_value.set.assert_not_called()
+
+
+def test_get_idn(device, tk_device):
+    system = ZINode(device, "system", snapshot_cache=device._snapshot_cache)
+    device.add_submodule("system", system)
+    fwrevision = add_parameter(
+        device, "fwrevision", "/dev1234/system/fwrevision", layer=system
+    )
+    fwrevision.get_raw.return_value = 12345
+    expected = {
+        "vendor": "Zurich Instruments",
+        "model": "UHFQA",
+        "serial": "dev1234",
+        "firmware": 12345,
+    }
+
+    idn = device.get_idn()
+    assert idn == expected
+    idn["firmware"] = 0
+    assert device.get_idn() == expected
+    fwrevision.get_raw.assert_called_once_with()
+
+    device.factory_reset()
+    tk_device.factory_reset.assert_called_once_with(deep=True)
+    assert device.get_idn() == expected
+    assert fwrevision.get_raw.call_count == 2
+
+
+def test_check_compatibility(device, tk_device):
+    device.check_compatibility()
+    device.check_compatibility()
+
+    tk_device.check_compatibility.assert_called_once_with()
+
+
+def test_check_compatibility_failed(device, tk_device):
+    tk_device.check_compatibility.side_effect = RuntimeError("Version mismatch")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            device.check_compatibility()
+
+    assert tk_device.check_compatibility.call_count == 2
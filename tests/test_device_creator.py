@@ -0,0 +1,178 @@
+import gc
+import importlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fixtures import mock_connection, data_dir, session
+from zhinst.qcodes import device_creator
+
+
+@pytest.fixture()
+def zi_session():
+    with patch("zhinst.qcodes.device_creator.ZISession") as zi_session, patch(
+        "zhinst.qcodes.device_creator.Session.is_valid", return_value=True
+    ):
+        zi_session.side_effect = lambda *args, **kwargs: MagicMock()
+        device_creator._SESSION_CACHE.clear()
+        yield zi_session
+        device_creator._SESSION_CACHE.clear()
+
+
+def get_session(allow_version_mismatch=False, new_session=False):
+    return device_creator._get_session(
+        "localhost",
+        8004,
+        hf2=False,
+        new_session=new_session,
+        allow_version_mismatch=allow_version_mismatch,
+    )
+
+
+def test_session_cache(zi_session):
+    session = get_session()
+
+    assert get_session() is session
+    zi_session.assert_called_once_with(
+        "localhost", 8004, hf2=False, allow_version_mismatch=False
+    )
+
+
+def test_session_cache_allow_version_mismatch(zi_session):
+    session = get_session(allow_version_mismatch=False)
+
+    assert get_session(allow_version_mismatch=True) is not session
+    assert zi_session.call_count == 2
+
+
+def test_session_cache_new_session(zi_session):
+    session = get_session()
+
+    assert get_session(new_session=True) is not session
+    assert get_session() is session
+
+
+def test_session_cache_weak(zi_session):
+    session = get_session()
+    assert len(device_creator._SESSION_CACHE) == 1
+
+    del session
+    gc.collect()
+
+    assert len(device_creator._SESSION_CACHE) == 0
+
+
+def test_session_cache_threads(zi_session):
+    def create_session(*args, **kwargs):
+        time.sleep(0.01)
+        return MagicMock()
+
+    zi_session.side_effect = create_session
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sessions = list(executor.map(lambda _: get_session(), range(4)))
+
+    assert all(session is sessions[0] for session in sessions)
+    zi_session.assert_called_once()
+
+
+def test_prewarm(zi_session):
+    session = MagicMock()
+    zi_session.side_effect = None
+    zi_session.return_value = session
+
+    thread = device_creator.prewarm("localhost")
+    thread.join()
+
+    zi_session.assert_called_once_with(
+        "localhost", 8004, hf2=False, allow_version_mismatch=False
+    )
+    assert get_session() is session
+
+
+def test_prewarm_error(zi_session, caplog):
+    zi_session.side_effect = RuntimeError("No data server")
+
+    thread = device_creator.prewarm("localhost", hf2=True)
+    thread.join()
+
+    assert "data server localhost:8005 failed" in caplog.text
+    assert "No data server" in caplog.text
+    assert len(device_creator._SESSION_CACHE) == 0
+
+
+@pytest.mark.parametrize("name, module", device_creator._LAZY_DEVICE_CLASSES.items())
+def test_lazy_device_class(name, module):
+    device_class = getattr(device_creator, name)
+
+    assert getattr(device_creator, name) is device_class
+    assert issubclass(device_class, getattr(importlib.import_module(module), name))
+    assert device_class.__name__ == name
+    assert device_class.__module__ == "zhinst.qcodes.device_creator"
+    assert device_class._DEFAULT_PORT == 8004
+    assert device_class._HF2 is False
+    assert device_class.__doc__.startswith(
+        f"QCoDeS driver for the Zurich Instruments {name}."
+    )
+    assert "(default = 8004)" in device_class.__doc__
+    assert name in dir(device_creator)
+
+
+def test_hf2_device_class():
+    assert device_creator.HF2._DEFAULT_PORT == 8005
+    assert device_creator.HF2._HF2 is True
+    assert "(default = 8005)" in device_creator.HF2.__doc__
+
+
+def test_unknown_device_class():
+    with pytest.raises(AttributeError):
+        device_creator.UNKNOWN
+
+
+def test_from_session(session):
+    tk_device = MagicMock()
+    tk_device.serial = "dev1234"
+    with patch.object(
+        session.toolkit_session, "connect_device", return_value=tk_device
+    ) as connect_device:
+        device = device_creator.MFLI.from_session(
+            session, "dev1234", interface="1GbE", name="test_mfli"
+        )
+    try:
+        connect_device.assert_called_once_with("dev1234", interface="1GbE")
+        assert isinstance(device, device_creator.MFLI)
+        assert device.name == "test_mfli"
+        assert device.session is session
+        assert session.devices._get_registered("dev1234") is device
+    finally:
+        device.close()
+
+
+def test_from_session_driver_init(session):
+    init_calls = []
+
+    class Driver(device_creator.ZIBaseInstrument):
+        def __init__(self, *args, **kwargs):
+            init_calls.append(kwargs["name"])
+            super().__init__(*args, **kwargs)
+
+    device_class = device_creator._make_device_class("Driver", Driver)
+    tk_device = MagicMock()
+    tk_device.serial = "dev1234"
+    with patch.object(
+        session.toolkit_session, "connect_device", return_value=tk_device
+    ):
+        device = device_class.from_session(session, "dev1234", name="test_driver")
+    try:
+        assert init_calls == ["test_driver"]
+        assert isinstance(device, Driver)
+    finally:
+        device.close()
+
+
+def test_from_session_invalid_serial(session):
+    with patch.object(session.toolkit_session, "connect_device") as connect_device:
+        with pytest.raises(ValueError):
+            device_creator.MFLI.from_session(session, "12000")
+    connect_device.assert_not_called()
@@ -0,0 +1,115 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from fixtures import (
+    mock_connection,
+    data_dir,
+    session,
+    tk_device,
+    device,
+    tk_module,
+    module,
+    add_parameter,
+)
+from zhinst.qcodes.driver.devices.base import ZIBaseInstrument
+from zhinst.qcodes.driver.modules import ZIBaseModule
+from zhinst.qcodes.qcodes_adaptions import module_instance_name
+
+
+def test_get_node_cache(session, device, tk_module, module):
+    session.devices._register(device)
+    parameter = add_parameter(device, "on", "/dev1234/on")
+    tk_node = tk_module._get_node.return_value
+    tk_node.raw_tree = ("on",)
+    tk_node.root.prefix_hide = "dev1234"
+
+    assert module._get_node("/dev1234/on") is parameter
+    assert module._get_node("/dev1234/on") is parameter
+    tk_module._get_node.assert_called_once_with("/dev1234/on")
+
+    # Reconnecting the device creates a new device object
+    del session.devices["dev1234"]
+    tk_device = MagicMock()
+    tk_device.serial = "dev1234"
+    reconnected = ZIBaseInstrument(tk_device, session, name="test_reconnected")
+    try:
+        session.devices._register(reconnected)
+        new_parameter = add_parameter(reconnected, "on", "/dev1234/on")
+
+        assert module._get_node("/dev1234/on") is new_parameter
+        assert tk_module._get_node.call_count == 2
+    finally:
+        reconnected.close()
+
+
+def test_module_instance_name():
+    assert module_instance_name("unique_test") == "zi_unique_test_0"
+    assert module_instance_name("unique_test") == "zi_unique_test_1"
+    assert module_instance_name("other_unique_test") == "zi_other_unique_test_0"
+
+
+def test_module_name_not_reused(session, tk_module):
+    first = ZIBaseModule(tk_module, session, "reuse_test")
+    first_name = first.name
+    first.close()
+    second = ZIBaseModule(tk_module, session, "reuse_test")
+    try:
+        assert second.name != first_name
+        assert second.name.startswith("zi_reuse_test_")
+    finally:
+        second.close()
+
+
+def test_set_node_parameter(device):
+    parameter = add_parameter(device, "on", "/dev1234/on")
+    with patch(
+        "zhinst.qcodes.driver.modules.base_module.TKBaseModule._set_node"
+    ) as tk_set_node:
+        assert ZIBaseModule._set_node(parameter) == "/dev1234/on"
+    tk_set_node.assert_not_called()
+
+
+@pytest.mark.parametrize("signal", ["/dev1234/on", MagicMock(spec=["node_info"])])
+def test_set_node_forwarded(signal):
+    with patch(
+        "zhinst.qcodes.driver.modules.base_module.TKBaseModule._set_node",
+        return_value="/dev1234/on",
+    ) as tk_set_node:
+        assert ZIBaseModule._set_node(signal) == "/dev1234/on"
+    tk_set_node.assert_called_once_with(signal)
+
+
+def test_set_node_invalid():
+    with patch(
+        "zhinst.qcodes.driver.modules.base_module.TKBaseModule._set_node",
+        side_effect=AttributeError,
+    ):
+        with pytest.raises(AttributeError):
+            ZIBaseModule._set_node(42)
+
+
+@pytest.mark.parametrize("function", ["subscribe", "unsubscribe"])
+def test_subscribe_single(device, tk_module, module, function):
+    parameter = add_parameter(device, "on", "/dev1234/on")
+    getattr(module, function)(parameter)
+    getattr(tk_module, function).assert_called_once_with("/dev1234/on")
+    getattr(tk_module, function).reset_mock()
+    getattr(module, function)("/dev1234/off")
+    getattr(tk_module, function).assert_called_once_with("/dev1234/off")
+
+
+@pytest.mark.parametrize("function", ["subscribe", "unsubscribe"])
+@pytest.mark.parametrize("container", [list, tuple])
+def test_subscribe_many(device, tk_module, module, function, container):
+    parameter = add_parameter(device, "on", "/dev1234/on")
+    tk_node = MagicMock(spec=["node_info"])
+    with patch(
+        "zhinst.qcodes.driver.modules.base_module.TKBaseModule._set_node",
+        side_effect=lambda signal: "/dev1234/tk" if signal is tk_node else signal,
+    ):
+        getattr(module, function)(container([parameter, "/dev1234/raw", tk_node]))
+    getattr(tk_module.raw_module, function).assert_called_once_with(
+        ["/dev1234/on", "/dev1234/raw", "/dev1234/tk"]
+    )
+    getattr(tk_module, function).assert_not_called()
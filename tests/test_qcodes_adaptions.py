@@ -0,0 +1,187 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from fixtures import mock_connection, data_dir, session, tk_device, device
+from zhinst.qcodes.qcodes_adaptions import (
+    ZIChannelList,
+    ZINode,
+    ZISnapshotHelper,
+    init_nodetree,
+    tk_node_to_qcodes_list,
+)
+
+
+def create_tk_node(*raw_tree):
+    tk_node = MagicMock()
+    tk_node.raw_tree = raw_tree
+    return tk_node
+
+
+@pytest.mark.parametrize(
+    "raw_tree, expected",
+    [
+        (("system", "fwrevision"), ["system", "fwrevision"]),
+        (("demods", "0", "rate"), ["demods0", "rate"]),
+        (("sigouts", "0", "enables", "1"), ["sigouts0", "enables1", "value"]),
+        (
+            ("awgs", "0", "outputs", "1", "gains", "0"),
+            ["awgs0", "outputs1", "gains0", "value"],
+        ),
+        (("sigins", "0", "2ndorder"), ["sigins0", "_2ndorder"]),
+    ],
+)
+def test_tk_node_to_qcodes_list(raw_tree, expected):
+    assert tk_node_to_qcodes_list(create_tk_node(*raw_tree)) == expected
+
+
+def test_init_nodetree_nested_lists(device):
+    nodes = [
+        ("sigouts", "0", "enables", "1"),
+        ("demods", "1", "rate"),
+        ("system", "fwrevision"),
+    ]
+    nodetree = [
+        (
+            create_tk_node(*raw_tree),
+            {"Node": "/DEV1234/" + "/".join(raw_tree).upper(), "Properties": "Read"},
+        )
+        for raw_tree in nodes
+    ]
+    init_nodetree(device, nodetree, device._snapshot_cache)
+
+    sigouts = device.submodules["sigouts"]
+    assert isinstance(sigouts, ZIChannelList)
+    assert sigouts._zi_node == "sigouts"
+    assert len(sigouts) == 1
+    assert sigouts[0].short_name == "sigouts0"
+    assert sigouts[0]._zi_node == "sigouts/0"
+    enables = sigouts[0].submodules["enables"]
+    assert isinstance(enables, ZIChannelList)
+    assert enables._zi_node == "sigouts/0/enables"
+    assert [x.short_name for x in enables] == ["enables0", "enables1"]
+    assert [x._zi_node for x in enables] == [
+        "sigouts/0/enables/0",
+        "sigouts/0/enables/1",
+    ]
+    assert enables[1].value.zi_node == "/DEV1234/SIGOUTS/0/ENABLES/1"
+
+    demods = device.submodules["demods"]
+    assert [x._zi_node for x in demods] == ["demods/0", "demods/1"]
+    assert demods[1].rate.zi_node == "/DEV1234/DEMODS/1/RATE"
+
+    system = device.submodules["system"]
+    assert isinstance(system, ZINode)
+    assert system._zi_node == "system"
+    assert system.fwrevision.zi_node == "/DEV1234/SYSTEM/FWREVISION"
+
+
+def test_init_nodetree_reuses_submodules(device):
+    nodetree = [
+        (create_tk_node("demods", "0", "rate"), {"Node": "/DEV1234/DEMODS/0/RATE"}),
+        (create_tk_node("demods", "0", "order"), {"Node": "/DEV1234/DEMODS/0/ORDER"}),
+    ]
+    init_nodetree(device, nodetree, device._snapshot_cache)
+
+    demods = device.submodules["demods"]
+    assert len(demods) == 1
+    assert set(demods[0].parameters) == {"rate", "order"}
+
+
+DEVICE_KWARGS = {
+    "excludestreaming": True,
+    "settingsonly": False,
+    "excludevectors": True,
+    "flat": True,
+}
+
+
+def create_snapshot_helper(prefix_hide, is_module=False, result=None):
+    nodetree = MagicMock()
+    nodetree.prefix_hide = prefix_hide
+    nodetree.connection.get.return_value = {} if result is None else result
+    return ZISnapshotHelper(nodetree, is_module=is_module)
+
+
+@pytest.mark.parametrize(
+    "name, path",
+    [
+        (None, "dev1234/*"),
+        ("demods", "/dev1234/demods/*"),
+        ("sigouts/0/enables", "/dev1234/sigouts/0/enables/*"),
+        ("/dev1234/demods", "/dev1234/demods/*"),
+    ],
+)
+def test_snapshot_device(name, path):
+    helper = create_snapshot_helper("dev1234")
+    with helper.snapshot(name):
+        assert helper.is_running
+    assert not helper.is_running
+    helper._nodetree.connection.get.assert_called_once_with(path, **DEVICE_KWARGS)
+
+
+def test_snapshot_batch_device():
+    helper = create_snapshot_helper("dev1234")
+    with helper.batch(["demods", "sigouts/0"]):
+        with helper.snapshot("demods"):
+            pass
+    helper._nodetree.connection.get.assert_called_once_with(
+        "/dev1234/demods/*,/dev1234/sigouts/0/*", **DEVICE_KWARGS
+    )
+
+
+@pytest.mark.parametrize(
+    "name, path",
+    [(None, "/*"), ("save", "/save/*"), ("sweep/settling", "/sweep/settling/*")],
+)
+def test_snapshot_module(name, path):
+    helper = create_snapshot_helper(None, is_module=True)
+    with helper.snapshot(name):
+        pass
+    helper._nodetree.connection.get.assert_called_once_with(path, flat=True)
+
+
+def test_snapshot_batch_module():
+    helper = create_snapshot_helper(None, is_module=True)
+    with helper.batch(["save", "sweep"]):
+        pass
+    helper._nodetree.connection.get.assert_called_once_with("/*", flat=True)
+
+
+def test_snapshot_batch_empty():
+    helper = create_snapshot_helper("dev1234")
+    with helper.batch([]):
+        assert not helper.is_running
+    helper._nodetree.connection.get.assert_not_called()
+
+
+def test_snapshot_values():
+    result = {
+        "/dev1234/demods/0/rate": {"timestamp": [0], "value": [np.float64(1.5)]},
+        "/dev1234/demods/0/order": {"timestamp": [0], "value": [np.array([3])]},
+        "/dev1234/demods/0/freqs": {
+            "timestamp": [0],
+            "value": [np.array([1.0, 2.0, 3.0])],
+        },
+        "/dev1234/system/fwrevision": [np.int64(70000)],
+    }
+    helper = create_snapshot_helper("dev1234", result=result)
+
+    def get(node):
+        parameter = MagicMock()
+        parameter._zi_node_lower = node
+        fallback = MagicMock(return_value="fallback")
+        return helper.get(parameter, fallback), fallback
+
+    with helper.snapshot():
+        value, fallback = get("/dev1234/demods/0/rate")
+        assert value == 1.5 and type(value) is float
+        fallback.assert_not_called()
+        value, _ = get("/dev1234/demods/0/order")
+        assert value == 3 and type(value) is int
+        value, _ = get("/dev1234/system/fwrevision")
+        assert value == 70000 and type(value) is int
+        value, fallback = get("/dev1234/demods/0/freqs")
+        assert value == "fallback"
+        fallback.assert_called_once_with()
@@ -0,0 +1,22 @@
+from unittest.mock import MagicMock
+
+from fixtures import mock_connection, data_dir, session, tk_device, device
+from zhinst.qcodes.driver.devices.shfqa import QAChannel
+
+
+def test_qachannel_missing_submodules(device):
+    tk_channel = MagicMock()
+    # Nodes that do not exist on the device evaluate to False
+    tk_channel.readout.__bool__.return_value = False
+    tk_channel.spectroscopy.__bool__.return_value = False
+    channel = QAChannel(
+        device,
+        tk_channel,
+        0,
+        zi_node="/dev1234/qachannels/0",
+        snapshot_cache=device._snapshot_cache,
+    )
+
+    assert "generator" in channel.submodules
+    assert "readout" not in channel.submodules
+    assert "spectroscopy" not in channel.submodules
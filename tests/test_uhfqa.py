@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from fixtures import mock_connection, data_dir, session, tk_device, device
+from zhinst.qcodes.driver.devices.uhfqa import QAS
+from zhinst.qcodes.qcodes_adaptions import NodeDict
+
+
+def create_qas(device):
+    tk_qas = MagicMock()
+    tk_qas.integration = None
+    qas = QAS(
+        device,
+        tk_qas,
+        0,
+        zi_node="/dev1234/qas/0",
+        snapshot_cache=device._snapshot_cache,
+    )
+    return qas, tk_qas
+
+
+def test_read_results(device):
+    qas, tk_qas = create_qas(device)
+    wave = tk_qas.result.data.__getitem__.return_value.wave
+    wave.return_value = {"/dev1234/qas/0/result/data/0/wave": np.ones(4)}
+
+    result = qas.read_results()
+
+    tk_qas.result.data.__getitem__.assert_called_once_with("*")
+    wave.assert_called_once_with(settingsonly=False)
+    assert isinstance(result, NodeDict)
+    assert np.array_equal(result["/dev1234/qas/0/result/data/0/wave"], np.ones(4))
+
+
+@pytest.mark.parametrize(
+    "matrix",
+    [np.ones(10), np.ones((11, 10)), np.ones((10, 11)), np.array([[1.0, np.nan]])],
+)
+def test_crosstalk_matrix_invalid(device, matrix):
+    qas, tk_qas = create_qas(device)
+
+    with pytest.raises(ValueError):
+        qas.crosstalk_matrix(matrix)
+
+    tk_qas.crosstalk_matrix.assert_not_called()
+    tk_qas.root.set_transaction.assert_not_called()
+
+
+def test_crosstalk_matrix(device):
+    qas, tk_qas = create_qas(device)
+    calls = []
+    tk_qas.root.transaction.in_progress.return_value = False
+    transaction = tk_qas.root.set_transaction.return_value
+    transaction.__enter__.side_effect = lambda: calls.append("start")
+    transaction.__exit__.side_effect = lambda *args: calls.append("end")
+    tk_qas.crosstalk_matrix.side_effect = lambda matrix: calls.append("set")
+    matrix = np.eye(2)
+
+    qas.crosstalk_matrix(matrix)
+
+    tk_qas.root.set_transaction.assert_called_once_with()
+    tk_qas.crosstalk_matrix.assert_called_once()
+    assert np.array_equal(tk_qas.crosstalk_matrix.call_args.kwargs["matrix"], matrix)
+    assert calls == ["start", "set", "end"]